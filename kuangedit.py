@@ -0,0 +1,3366 @@
+import re
+import os
+import sys
+import glob
+import json
+import time
+import pickle
+import math
+import heapq
+import bisect
+import hashlib
+import argparse
+import itertools
+from collections import OrderedDict, Counter
+import tkinter as tk
+from tkinter import ttk
+from tkinter import messagebox
+
+# Modules needed only by the daemon, background scans, process pools and rarely
+# used dialogs (asyncio, socket, threading, concurrent.futures, filedialog...) are
+# imported where they are used to keep startup fast.
+
+"""
+TranslatorApp: Enhanced GUI application for managing JSON-based Laravel translation files.
+Author: Krzysztof Pacyna & ChatGPT (Enhanced by Claude)
+Python Version: 3.8+
+Date: 2024-10-29 (Enhanced: 2025)
+
+Features:
+- Search functionality with real-time filtering
+- Keyboard shortcuts (Ctrl+S, Ctrl+F, Ctrl+N, Ctrl+D, Enter, Escape)
+- Improved text editing with multi-line support
+- Auto-save functionality
+- Better navigation and user experience
+- Status bar with statistics
+- Improved error handling and validation
+- Workspace mode with several lang directories open at once
+- Duplicate and inconsistent translation detection
+- Translation memory suggestions when adding and editing keys
+- Source code usage scan for unused and undefined keys
+- Placeholder, pluralization and markup consistency checks
+- Daemon mode serving a warm workspace over local JSON-RPC
+- Fast startup: the window shows first, files and rows stream in
+- Sortable columns backed by cached sort orders
+- Review changes since a recorded or git baseline
+"""
+
+# Startup: target time to first paint, and table rows inserted per event loop turn
+STARTUP_TARGET_MS = 200
+TABLE_CHUNK_ROWS = 500
+BACKGROUND_POLL_INTERVAL = 50  # milliseconds between checks for projects loaded in threads
+
+# Parsed projects are kept in memory until their estimated size exceeds this budget
+WORKSPACE_MEMORY_BUDGET = 256 * 1024 * 1024
+
+# Language whose values are the source text, if the project has it
+SOURCE_LANGUAGE = "en.json"
+
+# Translation memory: number of suggestions and minimum similarity (0-1) to show one
+SUGGESTION_COUNT = 5
+SUGGESTION_MIN_SCORE = 0.5
+
+# Source usage scan: calls like __('...'), trans('...'), trans_choice('...') and @lang('...')
+USAGE_PATTERN = re.compile(r"""(?:(?<![\w$])__|\btrans_choice|\btrans|@lang)\(\s*(['"])((?:\\.|(?!\1).)*?)\1""",
+                           re.DOTALL)
+SCAN_EXTENSIONS = (".php", ".js", ".jsx", ".ts", ".tsx", ".vue")
+SCAN_SKIP_DIRS = {".git", "node_modules", "vendor", "storage"}
+SCAN_PARALLEL_THRESHOLD = 64  # changed files needed before parsing in worker processes
+
+# Consistency checks: :name placeholders (not times like 10:30 or URLs), HTML tags
+# and the {0}/[1,*] prefixes of pluralization segments
+PLACEHOLDER_PATTERN = re.compile(r"(?<![\w:/]):([A-Za-z_]\w*)")
+TAG_PATTERN = re.compile(r"<(/?)([A-Za-z][\w-]*)[^<>]*?(/?)>")
+VALIDATE_CHUNK_SIZE = 2000  # keys per worker task of a full validation pass
+
+# Choices of the table's Show filter
+SHOW_ALL = "All"
+SHOW_UNUSED = "Unused"
+SHOW_UNDEFINED = "Used but undefined"
+SHOW_INVALID = "Inconsistent"
+SHOW_CHANGED = "Changed since baseline"
+SHOW_FILTERS = (SHOW_ALL, SHOW_UNUSED, SHOW_UNDEFINED, SHOW_INVALID, SHOW_CHANGED)
+
+# Cell markers of changes since the baseline
+CHANGE_ADDED = "+"
+CHANGE_REMOVED = "-"
+CHANGE_MODIFIED = "~"
+
+# Daemon mode: JSON-RPC 2.0, one message per line, on a Unix socket private to the user
+DAEMON_SOCKET = os.path.join(os.environ.get("XDG_RUNTIME_DIR") or os.environ.get("TMPDIR") or "/tmp",
+                             f"kuangedit-{os.getuid() if hasattr(os, 'getuid') else 0}.sock")
+DAEMON_TIMEOUT = 30  # seconds a client waits for a response
+DAEMON_POLL_INTERVAL = 100  # milliseconds between checks for changes from other clients
+DAEMON_MAX_MESSAGE = 64 * 1024 * 1024
+DAEMON_MAX_BACKLOG = 64 * 1024 * 1024  # unread notifications after which a subscriber is dropped
+
+# Store methods that mutate data; the daemon accepts them as calls and replays them as events
+STORE_MUTATIONS = ("set_value", "discard_value", "rename_key", "delete_key",
+                   "add_language", "remove_language", "change_source_language")
+
+# Per-project caches live outside the lang directory so they never end up in git
+CACHE_ROOT = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "kuangedit")
+
+
+class ProjectCache:
+    """On-disk cache for one lang directory, validated by a signature"""
+
+    def __init__(self, directory):
+        digest = hashlib.sha1(directory.encode("utf-8")).hexdigest()[:16]
+        self.path = os.path.join(CACHE_ROOT, digest)
+
+    def load(self, name, signature):
+        """Return the cached payload, or None if it is missing or stale"""
+        try:
+            with open(os.path.join(self.path, name + ".pickle"), "rb") as f:
+                cached_signature, payload = pickle.load(f)
+        except Exception:
+            # A missing, truncated or outdated cache is simply rebuilt
+            return None
+        return payload if cached_signature == signature else None
+
+    def save(self, name, signature, payload):
+        """Write payload atomically; caching is best effort"""
+        file_name = os.path.join(self.path, name + ".pickle")
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            with open(file_name + ".tmp", "wb") as f:
+                pickle.dump((signature, payload), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(file_name + ".tmp", file_name)
+        except OSError:
+            pass
+
+    def discard(self, name):
+        try:
+            os.remove(os.path.join(self.path, name + ".pickle"))
+        except OSError:
+            pass
+
+
+class SearchIndex:
+    """Lower-cased key and value text per key for substring search"""
+
+    def __init__(self):
+        self.keys = {}    # key -> key.lower()
+        self.values = {}  # key -> lower-cased values of all languages, one per line
+
+    def build(self, data):
+        """Index every key of every language"""
+        self.keys = {}
+        self.values = {}
+        all_keys = set()
+        for translations in data.values():
+            all_keys.update(translations.keys())
+        for key in all_keys:
+            self.update(key, data)
+
+    def update(self, key, data):
+        """Re-index a single key after it changed"""
+        values = [str(translations[key]) for translations in data.values() if key in translations]
+        if not values:
+            self.remove(key)
+            return
+        self.keys[key] = key.lower()
+        self.values[key] = "\n".join(values).lower()
+
+    def remove(self, key):
+        self.keys.pop(key, None)
+        self.values.pop(key, None)
+
+    def search(self, term, keys=True, values=True):
+        """Return the set of keys whose key or values contain the lower-cased term"""
+        matching_keys = set()
+        if keys:
+            matching_keys.update(key for key, text in self.keys.items() if term in text)
+        if values:
+            matching_keys.update(key for key, text in self.values.items() if term in text)
+        return matching_keys
+
+
+def normalize_value(value):
+    """Canonical form of a value: case, whitespace and trailing punctuation ignored"""
+    return " ".join(str(value).split()).lower().rstrip(".!?:;…")
+
+
+class ValueHashIndex:
+    """Keys grouped by the normalized form of their source-language value"""
+
+    def __init__(self):
+        self.buckets = {}     # normalized value -> set of keys
+        self.key_bucket = {}  # key -> normalized value
+
+    def build(self, translations):
+        """Index every key of the source language in one pass"""
+        self.buckets = {}
+        self.key_bucket = {}
+        for key, value in translations.items():
+            self.update(key, value)
+
+    def restore(self, key_bucket):
+        """Rebuild the buckets from a saved key_bucket without normalizing again"""
+        self.key_bucket = key_bucket
+        self.buckets = {}
+        for key, normalized in key_bucket.items():
+            self.buckets.setdefault(normalized, set()).add(key)
+
+    def update(self, key, value):
+        """Move a key to the bucket of its new value; empty values are not indexed"""
+        old = self.key_bucket.pop(key, None)
+        if old is not None:
+            bucket = self.buckets[old]
+            bucket.discard(key)
+            if not bucket:
+                del self.buckets[old]
+
+        normalized = normalize_value(value) if value else ""
+        if normalized:
+            self.key_bucket[key] = normalized
+            self.buckets.setdefault(normalized, set()).add(key)
+
+    def groups(self):
+        """Sets of two or more keys sharing a normalized value"""
+        return [keys for keys in self.buckets.values() if len(keys) > 1]
+
+
+class TranslationMemory:
+    """Character trigram index over source values for similarity lookups"""
+
+    def __init__(self):
+        self.postings = {}  # trigram -> set of keys
+        self.texts = {}     # key -> normalized source value
+        self.sizes = {}     # key -> number of distinct trigrams
+
+    @staticmethod
+    def trigrams(text):
+        padded = f"  {text} "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+    def build(self, translations):
+        """Index every non-empty source value"""
+        self.postings = {}
+        self.texts = {}
+        self.sizes = {}
+        for key, value in translations.items():
+            self.update(key, value)
+
+    def update(self, key, value):
+        """Re-index a key; empty values are removed from the memory"""
+        old_text = self.texts.pop(key, None)
+        if old_text is not None:
+            del self.sizes[key]
+            for gram in self.trigrams(old_text):
+                keys = self.postings[gram]
+                keys.discard(key)
+                if not keys:
+                    del self.postings[gram]
+
+        text = normalize_value(value) if value else ""
+        if text:
+            grams = self.trigrams(text)
+            self.texts[key] = text
+            self.sizes[key] = len(grams)
+            postings = self.postings
+            for gram in grams:
+                keys = postings.get(gram)
+                if keys is None:
+                    postings[gram] = {key}
+                else:
+                    keys.add(key)
+
+    def query(self, value, count=SUGGESTION_COUNT, exclude=None):
+        """Return up to count (score, key) pairs most similar to value, best first
+
+        Similarity is the Dice coefficient of the trigram sets. A key scoring at
+        least SUGGESTION_MIN_SCORE must share a minimum number of trigrams with
+        the query, so candidates only come from the posting lists of the rarest
+        trigrams; the common ones just add to the counts of those candidates.
+        """
+        text = normalize_value(value) if value else ""
+        if not text:
+            return []
+
+        grams = sorted(self.trigrams(text), key=lambda g: len(self.postings.get(g, ())))
+        min_shared = math.ceil(SUGGESTION_MIN_SCORE * len(grams) / (2 - SUGGESTION_MIN_SCORE))
+        prefix = len(grams) - min_shared + 1
+
+        shared = Counter()
+        for gram in grams[:prefix]:
+            shared.update(self.postings.get(gram, ()))
+        for gram in grams[prefix:]:
+            shared.update(shared.keys() & self.postings.get(gram, set()))
+        shared.pop(exclude, None)
+
+        scores = ((2 * common / (len(grams) + self.sizes[key]), key)
+                  for key, common in shared.items())
+        return [(score, key) for score, key in heapq.nlargest(count, scores)
+                if score >= SUGGESTION_MIN_SCORE]
+
+    def state(self):
+        return self.postings, self.texts, self.sizes
+
+    @classmethod
+    def from_state(cls, state):
+        memory = cls()
+        memory.postings, memory.texts, memory.sizes = state
+        return memory
+
+
+def scan_source_file(path):
+    """Return the sorted translation keys referenced in one source file"""
+    try:
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            text = f.read()
+    except OSError:
+        return ()
+
+    keys = set()
+    for quote, key in USAGE_PATTERN.findall(text):
+        # Double-quoted strings with variables are built at runtime
+        if quote == '"' and "$" in key:
+            continue
+        keys.add(key.replace("\\" + quote, quote))
+    return tuple(sorted(keys))
+
+
+class UsageScanner:
+    """Finds the translation keys referenced from a Laravel project's source code"""
+
+    def __init__(self, lang_directory):
+        self.lang_directory = os.path.abspath(lang_directory)
+        self.root = self.find_project_root(self.lang_directory)
+        self.cache = ProjectCache(self.lang_directory)
+        self.changed_files = 0
+
+    @staticmethod
+    def find_project_root(directory):
+        """Nearest parent holding artisan or composer.json, else the parent directory"""
+        current = directory
+        while True:
+            if os.path.exists(os.path.join(current, "artisan")) or \
+                    os.path.exists(os.path.join(current, "composer.json")):
+                return current
+            parent = os.path.dirname(current)
+            if parent == current:
+                return os.path.dirname(directory)
+            current = parent
+
+    def walk(self, top):
+        """Return {path: (mtime, size)} for the source files below top"""
+        files = {}
+        for dirpath, dirnames, filenames in os.walk(top):
+            dirnames[:] = [name for name in dirnames if name not in SCAN_SKIP_DIRS
+                           and os.path.join(dirpath, name) != self.lang_directory]
+            for name in filenames:
+                if name.endswith(SCAN_EXTENSIONS):
+                    path = os.path.join(dirpath, name)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    files[path] = (stat.st_mtime_ns, stat.st_size)
+        return files
+
+    def source_files(self):
+        """Walk the top-level directories of the project in parallel"""
+        files = {}
+        tops = []
+        for entry in os.scandir(self.root):
+            if entry.is_dir() and entry.name not in SCAN_SKIP_DIRS and entry.path != self.lang_directory:
+                tops.append(entry.path)
+            elif entry.is_file() and entry.name.endswith(SCAN_EXTENSIONS):
+                stat = entry.stat()
+                files[entry.path] = (stat.st_mtime_ns, stat.st_size)
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor() as executor:
+            for found in executor.map(self.walk, tops):
+                files.update(found)
+        return files
+
+    def scan(self):
+        """Return {key: [files using it]}, re-parsing only files changed since the last scan"""
+        files = self.source_files()
+        cached = self.cache.load("usage", self.root) or {}
+
+        results = {path: cached[path] for path, stamp in files.items()
+                   if path in cached and cached[path][0] == stamp}
+        changed = [path for path in files if path not in results]
+        if len(changed) >= SCAN_PARALLEL_THRESHOLD:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            # Spawned workers never inherit the Tk state of the GUI process
+            with ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn")) as executor:
+                found = list(executor.map(scan_source_file, changed, chunksize=32))
+        else:
+            found = [scan_source_file(path) for path in changed]
+        for path, keys in zip(changed, found):
+            results[path] = (files[path], keys)
+
+        self.changed_files = len(changed)
+        if changed or len(results) != len(cached):
+            self.cache.save("usage", self.root, results)
+
+        usage = {}
+        for path, (_, keys) in results.items():
+            for key in keys:
+                usage.setdefault(key, []).append(path)
+        return usage
+
+
+def cell_signature(value):
+    """Placeholders (case-insensitive), plural segment count and HTML tags of a value"""
+    value = str(value)
+    placeholders = frozenset()
+    if ":" in value:
+        placeholders = frozenset(name.lower() for name in PLACEHOLDER_PATTERN.findall(value))
+    plural = value.count("|") + 1 if "|" in value else 0
+    tags = Counter()
+    if "<" in value:
+        for closing, name, self_closing in TAG_PATTERN.findall(value):
+            tags[("/" if closing else "") + name.lower() + ("/" if self_closing else "")] += 1
+    return placeholders, plural, tags
+
+
+def compare_signatures(source, target):
+    """Describe how a translation's signature differs from the source's"""
+    problems = []
+    for name in sorted(source[0] - target[0]):
+        problems.append(f"missing :{name}")
+    for name in sorted(target[0] - source[0]):
+        problems.append(f"unknown :{name}")
+    # Languages have different numbers of plural forms, so only a lost or added pipe counts
+    if bool(source[1]) != bool(target[1]):
+        problems.append("pluralization missing" if source[1] else "unexpected pluralization")
+    for tag in sorted((source[2] - target[2]).keys()):
+        problems.append(f"missing <{tag}>")
+    for tag in sorted((target[2] - source[2]).keys()):
+        problems.append(f"unexpected <{tag}>")
+    return problems
+
+
+def is_plain(value):
+    """True if a value has no placeholders, pluralization or markup at all"""
+    value = str(value)
+    return ":" not in value and "|" not in value and "<" not in value
+
+
+def validate_key(values, source_lang):
+    """Return {lang: [problems]} for one key given {lang: value}"""
+    source_value = values.get(source_lang)
+    if not source_value:
+        return {}
+
+    source_plain = is_plain(source_value)
+    source = None
+    violations = {}
+    for lang, value in values.items():
+        if lang == source_lang or not value or (source_plain and is_plain(value)):
+            continue
+        source = source or cell_signature(source_value)
+        problems = compare_signatures(source, cell_signature(value))
+        if problems:
+            violations[lang] = problems
+    return violations
+
+
+def format_violations(violations, separator="; "):
+    """One entry per language: 'de: missing :count, unexpected <b>'"""
+    return separator.join(f"{lang.replace('.json', '')}: {', '.join(problems)}"
+                          for lang, problems in sorted(violations.items()))
+
+
+def validate_chunk(source_lang, rows):
+    """Validate [(key, {lang: value})] in a worker process"""
+    violations = {}
+    for key, values in rows:
+        problems = validate_key(values, source_lang)
+        if problems:
+            violations[key] = problems
+    return violations
+
+
+def cell_hash(value):
+    """Compact content hash of one cell"""
+    return hashlib.blake2b(str(value).encode("utf-8"), digest_size=8).digest()
+
+
+class Baseline:
+    """Per-cell content hashes of a reference version of a catalogue
+
+    Empty values count as absent, as they are dropped when saving.
+    """
+
+    def __init__(self, hashes, label):
+        self.hashes = hashes  # {lang: {key: hash}}
+        self.label = label    # e.g. 'git 1a2b3c4' or 'snapshot 14:02'
+
+    @classmethod
+    def from_data(cls, data, label):
+        return cls({lang: {key: cell_hash(value) for key, value in translations.items() if value}
+                    for lang, translations in data.items()}, label)
+
+    @classmethod
+    def from_state(cls, state):
+        return cls(state["hashes"], state["label"])
+
+    def state(self):
+        return {"hashes": self.hashes, "label": self.label}
+
+    @staticmethod
+    def marker(old_hash, value):
+        """CHANGE_* marker of a cell, or None if it is unchanged"""
+        if not value:
+            return CHANGE_REMOVED if old_hash else None
+        if old_hash is None:
+            return CHANGE_ADDED
+        return CHANGE_MODIFIED if old_hash != cell_hash(value) else None
+
+    def compare(self, data):
+        """{key: {lang: marker}} of all changed cells, hashing each cell once"""
+        changes = {}
+        for lang in set(data) | set(self.hashes):
+            old = self.hashes.get(lang, {})
+            new = data.get(lang, {})
+            for key, value in new.items():
+                marker = self.marker(old.get(key), value)
+                if marker:
+                    changes.setdefault(key, {})[lang] = marker
+            for key in old.keys() - new.keys():
+                changes.setdefault(key, {})[lang] = CHANGE_REMOVED
+        return changes
+
+    def compare_key(self, key, data):
+        """{lang: marker} of the changed cells of one key"""
+        markers = {}
+        for lang in set(data) | set(self.hashes):
+            marker = self.marker(self.hashes.get(lang, {}).get(key), data.get(lang, {}).get(key))
+            if marker:
+                markers[lang] = marker
+        return markers
+
+
+def read_git_revision(directory, revision):
+    """Return ({file name: JSON text}, short commit) of a lang directory at a git revision"""
+    import subprocess
+
+    if revision.startswith("-"):
+        # Would be read as an option; revisions reach here from daemon clients too
+        raise ValueError(f"Invalid revision: {revision}")
+
+    def git(*args):
+        try:
+            result = subprocess.run(["git", "-C", directory, *args], capture_output=True)
+        except FileNotFoundError:
+            raise ValueError("git is not installed")
+        if result.returncode != 0:
+            raise ValueError(result.stderr.decode("utf-8", "replace").strip() or f"git {args[0]} failed")
+        return result.stdout.decode("utf-8")
+
+    commit = git("rev-parse", "--short", "--verify", f"{revision}^{{commit}}").strip()
+    prefix = git("rev-parse", "--show-prefix").strip()
+    files = {}
+    for file_name in git("ls-tree", "--full-tree", "--name-only", f"{commit}:{prefix}").splitlines():
+        if file_name.endswith(".json"):
+            files[file_name] = git("show", f"{commit}:{prefix}{file_name}")
+    return files, commit
+
+
+class SortIndex:
+    """Cached sort orders of a store's keys, kept current as keys change
+
+    A sort spec is ("key",), ("missing",), ("usage",), ("value", lang) or
+    ("length", lang). Each cached order is a sorted list of (sort value, key);
+    descending views just walk it backwards.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self.orders = {}  # spec -> sorted list of (sort value, key)
+        self.values = {}  # spec -> {key: sort value}
+
+    def sort_value(self, spec, key):
+        store = self.store
+        if spec[0] == "key":
+            return key.lower()
+        if spec[0] == "missing":
+            return sum(1 for translations in store.data.values() if not translations.get(key))
+        if spec[0] == "usage":
+            return len(store.usage.get(key, ())) if store.usage else 0
+        value = str(store.data.get(spec[1], {}).get(key, ""))
+        return value.lower() if spec[0] == "value" else len(value)
+
+    def order(self, spec):
+        """Return the ascending order for spec, sorting only the first time"""
+        if spec not in self.orders:
+            values = {key: self.sort_value(spec, key) for key in self.store.index.keys}
+            self.values[spec] = values
+            self.orders[spec] = sorted((value, key) for key, value in values.items())
+            self.store._size = None
+        return self.orders[spec]
+
+    def update(self, key):
+        """Move a changed key to its new position in every cached order"""
+        exists = self.store.has_key(key)
+        for spec, order in self.orders.items():
+            values = self.values[spec]
+            if key in values:
+                del order[bisect.bisect_left(order, (values.pop(key), key))]
+            if exists:
+                values[key] = self.sort_value(spec, key)
+                bisect.insort(order, (values[key], key))
+
+    def discard(self, spec):
+        self.orders.pop(spec, None)
+        self.values.pop(spec, None)
+
+    def clear(self):
+        self.orders = {}
+        self.values = {}
+
+
+class TranslationStore:
+    """Translation files of one lang directory: {file name: {key: value}}"""
+
+    def __init__(self, directory):
+        self.directory = os.path.abspath(directory)
+        self.data = {}
+        self.errors = []  # (file name, error message) from the last load
+        self.dirty = False
+        self.index = SearchIndex()
+        self.duplicates = ValueHashIndex()
+        self.source_lang = None
+        self.memory = None  # TranslationMemory, built on first use
+        self.memory_signature = None  # signature the memory is cached under, if it is
+        self.memory_changes = None    # keys changed while the memory is built in a thread
+        self.usage = None   # {key: [source files]} from the last usage scan
+        self.php_groups = set()  # names of PHP group files, e.g. auth for lang/en/auth.php
+        self.unused = set()      # defined keys missing from usage
+        self.undefined = set()   # used JSON keys missing from the data
+        self.violations = {}  # {key: {lang: [problems]}} against the source language
+        self.listeners = []   # callables(store, event, params) run after each mutation
+        self.sorts = SortIndex(self)
+        self.baseline = None  # Baseline, kept across reloads
+        self.changes = {}     # {key: {lang: CHANGE_*}} since the baseline
+        self.cache = ProjectCache(self.directory)
+        self._size = None
+
+    @property
+    def name(self):
+        """Short project name, e.g. 'shop/lang'"""
+        parent, base = os.path.split(self.directory)
+        return os.path.join(os.path.basename(parent), base) if parent else base
+
+    def path(self, file_name):
+        return os.path.join(self.directory, file_name)
+
+    def languages(self):
+        return sorted(self.data.keys())
+
+    @staticmethod
+    def clean_json(json_text):
+        """Clean JSON text by removing trailing commas"""
+        return re.sub(r",\s*([}\]])", r"\1", json_text)
+
+    def file_signature(self):
+        """Names, sizes and modification times of the JSON files on disk"""
+        signature = []
+        for file_name in sorted(glob.glob(self.path("*.json"))):
+            stat = os.stat(file_name)
+            signature.append((os.path.basename(file_name), stat.st_size, stat.st_mtime_ns))
+        return tuple(signature)
+
+    def load(self, validate=True):
+        """Load all JSON files, reusing the cached indexes when nothing changed
+
+        With validate=False the consistency check is left to validate_all.
+        """
+        self.data = {}
+        self.errors = []
+        self.dirty = False
+        self._size = None
+        self.sorts.clear()
+
+        # Parsing JSON is as fast as unpickling it, so only derived structures are cached
+        files = self.file_signature()
+        signature = ("indexes", files)
+        for file_name, _, _ in files:
+            try:
+                with open(self.path(file_name), "r", encoding="utf-8") as f:
+                    self.data[file_name] = json.loads(self.clean_json(f.read()))
+            except (json.JSONDecodeError, FileNotFoundError) as e:
+                self.data[file_name] = {}
+                self.errors.append((file_name, str(e)))
+
+        cached = None if self.errors else self.cache.load("store", signature)
+        if cached is not None:
+            self.index.keys, self.index.values = cached["index"]
+            self.source_lang = cached["source_lang"]
+            self.duplicates.restore(cached["duplicates"])
+            self.memory = None
+            self.memory_changes = None
+            self.violations = {}
+            if validate:
+                # None when the cache was written without validating
+                self.violations = cached["violations"]
+                if self.violations is None:
+                    self.violations = cached["violations"] = self.validate_all(workers=0)
+                    self.cache.save("store", signature, cached)
+        else:
+            self.index.build(self.data)
+            self.set_source_language(None, validate)
+            if not self.errors:
+                self.cache.save("store", signature, {"index": (self.index.keys, self.index.values),
+                                                     "source_lang": self.source_lang,
+                                                     "duplicates": self.duplicates.key_bucket,
+                                                     "violations": self.violations if validate else None})
+        self.compare_baseline()
+        self.classify_usage()
+
+    def replace_data(self, data, source_lang=None, dirty=False):
+        """Use translations loaded elsewhere, e.g. received from the daemon"""
+        self.data = data
+        self.errors = []
+        self.dirty = dirty
+        self._size = None
+        self.sorts.clear()
+        self.index.build(self.data)
+        self.set_source_language(source_lang if source_lang in data else None)
+        self.compare_baseline()
+        self.classify_usage()
+
+    def save(self):
+        """Write all files, dropping empty values; return the number of files saved"""
+        saved_files = 0
+        for lang, translations in self.data.items():
+            data_to_save = {key: val for key, val in translations.items() if val}
+
+            with open(self.path(lang), "w", encoding="utf-8") as f:
+                json.dump(data_to_save, f, ensure_ascii=False, indent=4, sort_keys=True)
+            saved_files += 1
+
+        self.dirty = False
+        return saved_files
+
+    def all_keys(self):
+        return set(self.index.keys)
+
+    def has_key(self, key):
+        return key in self.index.keys
+
+    def set_value(self, lang, key, value):
+        self.data[lang][key] = value
+        self._key_changed(key)
+        self._notify("set_value", lang=lang, key=key, value=value)
+
+    def discard_value(self, lang, key):
+        if self.data[lang].pop(key, None) is not None:
+            self._key_changed(key)
+            self._notify("discard_value", lang=lang, key=key)
+
+    def rename_key(self, old_key, new_key):
+        for translations in self.data.values():
+            if old_key in translations:
+                translations[new_key] = translations.pop(old_key)
+        self._key_changed(old_key)
+        self._key_changed(new_key)
+        self._notify("rename_key", old_key=old_key, new_key=new_key)
+
+    def delete_key(self, key):
+        for translations in self.data.values():
+            translations.pop(key, None)
+        self._key_changed(key)
+        self._notify("delete_key", key=key)
+
+    def set_source_language(self, lang, validate=True):
+        """Use lang as the source language, or pick a default when lang is None"""
+        if lang is None:
+            languages = self.languages()
+            lang = SOURCE_LANGUAGE if SOURCE_LANGUAGE in self.data else (languages[0] if languages else None)
+        self.source_lang = lang
+        self.duplicates.build(self.data.get(lang, {}))
+        self.memory = None
+        self.memory_changes = None
+        self.violations = self.validate_all(workers=0) if validate else {}
+
+    def change_source_language(self, lang):
+        """Use lang as the source language at the user's request"""
+        if lang not in self.data:
+            raise ValueError(f"Unknown language: {lang}")
+        self.set_source_language(lang)
+        self._notify("change_source_language", lang=lang)
+
+    def translation_memory(self):
+        """Return the translation memory, loading it from the cache or building it"""
+        if self.memory is None:
+            self.finish_memory(*self.build_memory(*self.start_memory()))
+        return self.memory
+
+    def start_memory(self):
+        """Begin building the memory, e.g. in a thread; return the arguments of build_memory"""
+        self.memory_changes = set()
+        # The files only describe the values if nothing is unsaved
+        signature = (self.file_signature(), self.source_lang) if not self.dirty and not self.errors else None
+        return dict(self.data.get(self.source_lang, {})), signature
+
+    def build_memory(self, translations, signature):
+        """Load the memory from the cache or build it from a copy of the source values
+
+        Touches no state of the store, so it can run in a thread. Returns the memory
+        and the signature it is cached under, or None.
+        """
+        state = self.cache.load("memory", signature) if signature else None
+        if state is not None:
+            return TranslationMemory.from_state(state), signature
+
+        memory = TranslationMemory()
+        memory.build(translations)
+        if signature:
+            self.cache.save("memory", signature, memory.state())
+        return memory, signature
+
+    def finish_memory(self, memory, signature):
+        """Use a memory from build_memory, catching up with keys changed meanwhile"""
+        if self.memory_changes is None:
+            # The source language changed while it was built
+            return
+        source = self.data.get(self.source_lang, {})
+        for key in self.memory_changes:
+            memory.update(key, source.get(key))
+        self.memory = memory
+        self.memory_signature = signature if not self.memory_changes else None
+        self.memory_changes = None
+        self._size = None
+
+    def save_memory(self):
+        """Cache the memory for the next session, e.g. on exit, if it matches the saved files"""
+        if self.memory is None or self.dirty or self.errors:
+            return
+        signature = (self.file_signature(), self.source_lang)
+        if signature != self.memory_signature:
+            self.cache.save("memory", signature, self.memory.state())
+            self.memory_signature = signature
+
+    def suggestions(self, value, exclude=None):
+        """Existing entries similar to value: [(score, key, {lang: translation})]"""
+        return [(score, key, {lang: translations[key] for lang, translations in self.data.items()
+                              if translations.get(key)})
+                for score, key in self.translation_memory().query(value, exclude=exclude)]
+
+    def add_language(self, lang):
+        self.data[lang] = {}
+        self.dirty = True
+        self.sorts.clear()
+        self.compare_baseline()
+        if self.source_lang is None:
+            self.set_source_language(None)
+        self._notify("add_language", lang=lang)
+
+    def remove_language(self, lang):
+        """Remove a language and delete its file"""
+        keys = list(self.data.pop(lang))
+        try:
+            os.remove(self.path(lang))
+        except FileNotFoundError:
+            pass
+        for key in keys:
+            self.index.update(key, self.data)
+            self.validate(key)
+        if lang == self.source_lang:
+            self.set_source_language(None)
+        self.dirty = True
+        self._size = None
+        self.sorts.clear()
+        self.compare_baseline()
+        self.classify_usage()
+        self._notify("remove_language", lang=lang)
+
+    def _notify(self, event, **params):
+        """Tell listeners about a mutation; event is the name of the method to replay it"""
+        for listener in self.listeners:
+            listener(self, event, params)
+
+    def _key_changed(self, key):
+        """Keep derived indexes in step with a changed key"""
+        self.index.update(key, self.data)
+        source_value = self.data.get(self.source_lang, {}).get(key)
+        self.duplicates.update(key, source_value)
+        if self.memory is not None:
+            self.memory.update(key, source_value)
+        elif self.memory_changes is not None:
+            self.memory_changes.add(key)
+        self.validate(key)
+        self.sorts.update(key)
+        if self.usage is not None:
+            self.classify_key(key)
+        if self.baseline is not None:
+            markers = self.baseline.compare_key(key, self.data)
+            if markers:
+                self.changes[key] = markers
+            else:
+                self.changes.pop(key, None)
+        self.dirty = True
+        self._size = None
+
+    def set_usage(self, usage):
+        """Store the results of a usage scan"""
+        self.usage = usage
+        self.php_groups = {os.path.splitext(os.path.basename(path))[0] for path in glob.glob(self.path("*/*.php"))}
+        self.sorts.discard(("usage",))
+        self.classify_usage()
+        self._size = None
+
+    def classify_usage(self):
+        """Recompute the unused and undefined keys of the whole catalogue"""
+        self.unused = set()
+        self.undefined = set()
+        if self.usage is not None:
+            for key in itertools.chain(self.index.keys, self.usage):
+                self.classify_key(key)
+
+    def classify_key(self, key):
+        """Move one key in or out of the unused and undefined sets
+
+        Keys of PHP group files (auth.failed for lang/en/auth.php) and package
+        namespaces (package::file.key) are not JSON translations and never undefined.
+        """
+        defined = key in self.index.keys
+        used = key in self.usage
+        if defined and not used:
+            self.unused.add(key)
+        else:
+            self.unused.discard(key)
+        if used and not defined and "::" not in key and not ("." in key and key.split(".", 1)[0] in self.php_groups):
+            self.undefined.add(key)
+        else:
+            self.undefined.discard(key)
+
+    def compare_baseline(self):
+        """Recompute the changes since the baseline, loading a recorded one first"""
+        if self.baseline is None:
+            state = self.cache.load("baseline", self.directory)
+            self.baseline = Baseline.from_state(state) if state is not None else None
+        self.changes = self.baseline.compare(self.data) if self.baseline is not None else {}
+        self._size = None
+
+    def set_baseline(self, baseline, persist=True):
+        """Compare against baseline from now on, remembering it for later sessions if persist"""
+        self.baseline = baseline
+        if persist:
+            self.cache.save("baseline", self.directory, baseline.state())
+        else:
+            self.cache.discard("baseline")
+        self.compare_baseline()
+
+    def clear_baseline(self):
+        """Stop comparing against a baseline"""
+        self.baseline = None
+        self.cache.discard("baseline")
+        self.compare_baseline()
+
+    def record_baseline(self):
+        """Use the current values as the baseline"""
+        self.set_baseline(Baseline.from_data(self.data, time.strftime("snapshot %Y-%m-%d %H:%M")))
+
+    def import_baseline(self, revision="HEAD", persist=True):
+        """Use the lang files of a local git revision as the baseline"""
+        files, commit = read_git_revision(self.directory, revision)
+        data = {}
+        for file_name, text in files.items():
+            try:
+                data[file_name] = json.loads(self.clean_json(text))
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{file_name} at {commit}: {str(e)}")
+        self.set_baseline(Baseline.from_data(data, f"git {commit}"), persist)
+
+    def values_of(self, key):
+        """{lang: value} of one key in the languages that have it"""
+        return {lang: translations[key] for lang, translations in self.data.items() if key in translations}
+
+    def validate(self, key):
+        """Re-check the cells of one key against the source language"""
+        problems = validate_key(self.values_of(key), self.source_lang)
+        if problems:
+            self.violations[key] = problems
+        else:
+            self.violations.pop(key, None)
+
+    def validate_all(self, workers=None):
+        """Check the whole catalogue; return {key: {lang: [problems]}}
+
+        Large catalogues are split into chunks checked on a process pool,
+        unless workers is 0.
+        """
+        source = self.data.get(self.source_lang, {})
+        others = [(lang, translations) for lang, translations in self.data.items() if lang != self.source_lang]
+        rows = []
+        for key, value in source.items():
+            values = {self.source_lang: value}
+            for lang, translations in others:
+                if key in translations:
+                    values[lang] = translations[key]
+            rows.append((key, values))
+        if workers == 0:
+            return validate_chunk(self.source_lang, rows)
+        chunks = [rows[i:i + VALIDATE_CHUNK_SIZE] for i in range(0, len(rows), VALIDATE_CHUNK_SIZE)]
+
+        violations = {}
+        if len(chunks) > 1:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=workers,
+                                     mp_context=multiprocessing.get_context("spawn")) as executor:
+                for found in executor.map(validate_chunk, [self.source_lang] * len(chunks), chunks):
+                    violations.update(found)
+        elif chunks:
+            violations = validate_chunk(self.source_lang, chunks[0])
+        return violations
+
+    def duplicate_groups(self):
+        """Keys with identical or near-identical source values
+
+        Returns a list of dicts with the normalized value, the sorted keys, whether
+        the source values are exactly identical and the languages whose
+        translations diverge between those keys.
+        """
+        source = self.data.get(self.source_lang, {})
+        groups = []
+        for keys in self.duplicates.groups():
+            keys = sorted(keys, key=str.lower)
+            diverging = []
+            for lang in self.languages():
+                if lang == self.source_lang:
+                    continue
+                translations = {normalize_value(self.data[lang][key]) for key in keys
+                                if self.data[lang].get(key)}
+                if len(translations) > 1:
+                    diverging.append(lang)
+            groups.append({
+                "value": self.duplicates.key_bucket[keys[0]],
+                "keys": keys,
+                "exact": len({source[key] for key in keys}) == 1,
+                "diverging": diverging,
+            })
+        groups.sort(key=lambda group: (not group["diverging"], group["value"]))
+        return groups
+
+    def unused_keys(self):
+        """Keys not referenced anywhere in the scanned source code"""
+        return self.unused
+
+    def undefined_keys(self):
+        """Keys used in source code but missing from the JSON files, see classify_key"""
+        return self.undefined
+
+    def estimated_size(self):
+        """Rough number of bytes held by the parsed data and everything derived from it
+
+        Keys are counted once, in the data; the derived structures share them.
+        """
+        if self._size is None:
+            def values_size(mapping):
+                return sys.getsizeof(mapping) + sum(map(sys.getsizeof, mapping.values()))
+
+            size = 0
+            for translations in self.data.values():
+                size += values_size(translations) + sum(map(sys.getsizeof, translations))
+            size += values_size(self.index.keys) + values_size(self.index.values)
+            size += values_size(self.duplicates.key_bucket) + values_size(self.duplicates.buckets)
+            size += values_size(self.violations) + sum(map(values_size, self.violations.values()))
+            if self.usage is not None:
+                size += values_size(self.usage) + sys.getsizeof(self.unused) + sys.getsizeof(self.undefined)
+            if self.memory is not None:
+                postings, texts, sizes = self.memory.state()
+                size += values_size(postings) + sum(map(sys.getsizeof, postings))
+                size += values_size(texts) + values_size(sizes)
+            for spec, order in self.sorts.orders.items():
+                size += sys.getsizeof(order) + sum(sys.getsizeof(entry) + sys.getsizeof(entry[0]) for entry in order)
+                size += sys.getsizeof(self.sorts.values[spec])
+            if self.baseline is not None:
+                size += sum(map(values_size, self.baseline.hashes.values()))
+            self._size = size
+        return self._size
+
+
+class Workspace:
+    """Several lang directories open in one process, kept warm in an LRU"""
+
+    def __init__(self, memory_budget=WORKSPACE_MEMORY_BUDGET, loader=None):
+        self.memory_budget = memory_budget
+        self.loader = loader  # callable(store) filling a new store, default: read its files
+        self.projects = []           # directories in the order they were opened
+        self.stores = OrderedDict()  # directory -> loaded store, most recently used last
+        self.active = None
+
+    def add(self, directory):
+        """List a project without loading it yet"""
+        directory = os.path.abspath(directory)
+        if directory not in self.projects:
+            self.projects.append(directory)
+
+    def open(self, directory, activate=True):
+        """Return the store for directory, loading it if it is not warm"""
+        store = self.stores.get(os.path.abspath(directory))
+        if store is None:
+            store = TranslationStore(directory)
+            self.load(store)
+        return self.adopt(store, activate)
+
+    def adopt(self, store, activate=True):
+        """Add a loaded store, e.g. one loaded in a background thread, and return the open one
+
+        If its project was opened meanwhile, the store already open is kept with its edits.
+        """
+        directory = store.directory
+        if directory not in self.projects:
+            self.projects.append(directory)
+
+        if directory in self.stores:
+            store = self.stores[directory]
+            self.stores.move_to_end(directory)
+        else:
+            self.stores[directory] = store
+
+        if activate:
+            self.active = directory
+        self.evict()
+        return store
+
+    def load(self, store):
+        """(Re)load a store through the loader"""
+        if self.loader:
+            self.loader(store)
+        else:
+            store.load()
+
+    def close(self, directory):
+        self.projects.remove(directory)
+        self.stores.pop(directory, None)
+        if self.active == directory:
+            self.active = None
+
+    def memory_usage(self):
+        return sum(store.estimated_size() for store in self.stores.values())
+
+    def evict(self):
+        """Drop least recently used stores until the budget is met"""
+        usage = self.memory_usage()
+        for directory, store in list(self.stores.items()):
+            if usage <= self.memory_budget:
+                break
+            # Never drop the project on screen or edits that are not saved yet
+            if directory == self.active or store.dirty:
+                continue
+            usage -= store.estimated_size()
+            del self.stores[directory]
+
+    def search(self, term, keys=True, values=True):
+        """Search every project, reusing warm indexes; return [(store, key)]"""
+        results = []
+        for directory in list(self.projects):
+            store = self.open(directory, activate=False)
+            for key in sorted(store.index.search(term, keys, values), key=str.lower):
+                results.append((store, key))
+        return results
+
+
+class DaemonError(Exception):
+    """A JSON-RPC call to the daemon failed"""
+
+
+class TranslationDaemon:
+    """Serves a warm workspace to many local clients over JSON-RPC
+
+    Every call may name a project (a lang directory); the first project is used
+    otherwise. Clients that subscribe get a "changed" notification for every
+    mutation, save and reload, tagged with the id of the client that caused it.
+    """
+
+    def __init__(self, workspace, socket_path=DAEMON_SOCKET):
+        self.workspace = workspace
+        self.socket_path = socket_path
+        self.writers = {}      # client id -> stream writer
+        self.subscribers = {}  # client id -> directory, or None for all projects
+        self.next_client = 1
+        self.current_client = None  # client whose call is being handled
+
+        self.methods = {
+            "projects": self.rpc_projects,
+            "open": self.rpc_open,
+            "dump": self.rpc_dump,
+            "languages": lambda store: store.languages(),
+            "keys": lambda store: [key for _, key in store.sorts.order(("key",))],
+            "get": lambda store, key: store.values_of(key),
+            "search": self.rpc_search,
+            "suggest": lambda store, text, exclude=None: store.suggestions(text, exclude),
+            "duplicates": lambda store: store.duplicate_groups(),
+            "violations": lambda store: store.violations,
+            "changes": lambda store: store.changes,
+            "baseline": self.rpc_baseline,
+            "add_key": self.rpc_add_key,
+            "save": self.rpc_save,
+            "reload": self.rpc_reload,
+            "subscribe": self.rpc_subscribe,
+        }
+        for name in STORE_MUTATIONS:
+            self.methods[name] = self.mutation(name)
+
+    @staticmethod
+    def mutation(name):
+        """Call the store method name with only the params it declares"""
+        import inspect
+
+        accepted = set(inspect.signature(getattr(TranslationStore, name)).parameters) - {"self"}
+
+        def call(store, **params):
+            unexpected = params.keys() - accepted
+            if unexpected:
+                raise ValueError(f"unexpected params for {name}: {', '.join(sorted(unexpected))}")
+            return getattr(store, name)(**params)
+        return call
+
+    def store(self, directory=None):
+        """Open a project, making sure its mutations are broadcast"""
+        if directory is None:
+            if not self.workspace.projects:
+                raise ValueError("No projects are open")
+            directory = self.workspace.projects[0]
+        elif not os.path.isdir(directory):
+            raise ValueError(f"Not a directory: {directory}")
+        store = self.workspace.open(directory, activate=False)
+        if self.broadcast not in store.listeners:
+            store.listeners.append(self.broadcast)
+        return store
+
+    def rpc_projects(self):
+        return [{"project": directory, "name": os.path.basename(directory),
+                 "loaded": directory in self.workspace.stores,
+                 "dirty": directory in self.workspace.stores and self.workspace.stores[directory].dirty}
+                for directory in self.workspace.projects]
+
+    def rpc_open(self, store):
+        return {"project": store.directory, "languages": store.languages(), "keys": len(store.index.keys)}
+
+    def rpc_dump(self, store):
+        return {"project": store.directory, "source_lang": store.source_lang,
+                "dirty": store.dirty, "data": store.data}
+
+    def rpc_search(self, term, keys=True, values=True, project=None):
+        term = term.lower()
+        if project:
+            return sorted(self.store(project).index.search(term, keys, values), key=str.lower)
+        return [[store.directory, key] for store, key in self.workspace.search(term, keys, values)]
+
+    def rpc_add_key(self, store, key, values):
+        if store.has_key(key):
+            raise ValueError(f"Key '{key}' already exists")
+        for lang in store.languages():
+            store.set_value(lang, key, values.get(lang, ""))
+        return store.values_of(key)
+
+    def rpc_save(self, store):
+        saved_files = store.save()
+        self.broadcast(store, "saved", {})
+        return saved_files
+
+    def rpc_reload(self, store):
+        store.load()
+        self.broadcast(store, "reloaded", {})
+        return {"languages": store.languages(), "keys": len(store.index.keys)}
+
+    def rpc_baseline(self, store, revision=None, clear=False):
+        if clear:
+            store.clear_baseline()
+            return {"baseline": None, "changes": 0}
+        if revision:
+            store.import_baseline(revision)
+        else:
+            store.record_baseline()
+        return {"baseline": store.baseline.label, "changes": len(store.changes)}
+
+    def rpc_subscribe(self, project=None):
+        self.subscribers[self.current_client] = os.path.abspath(project) if project else None
+        return {"client": self.current_client}
+
+    def call(self, method, params):
+        """Run one method; project-bound methods get the store instead of the project"""
+        function = self.methods[method]
+        if method in ("projects", "search", "subscribe"):
+            return function(**params)
+        return function(self.store(params.pop("project", None)), **params)
+
+    def handle_message(self, client, line):
+        """Return the JSON-RPC response to one request line, or None for notifications"""
+        try:
+            request = json.loads(line)
+        except ValueError:
+            return {"jsonrpc": "2.0", "id": None, "error": {"code": -32700, "message": "Parse error"}}
+        if not isinstance(request, dict):
+            return {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Invalid Request"}}
+
+        method = request.get("method")
+        params = request.get("params", {})
+        result = None
+        if not isinstance(method, str) or not isinstance(params, dict):
+            error = {"code": -32600, "message": "Invalid Request"}
+        elif method not in self.methods:
+            error = {"code": -32601, "message": f"Method not found: {method}"}
+        else:
+            self.current_client = client
+            try:
+                result = self.call(method, dict(params))
+                error = None
+            except (TypeError, KeyError, ValueError) as e:
+                error = {"code": -32602, "message": f"Invalid params: {str(e)}"}
+            except Exception as e:
+                error = {"code": -32000, "message": str(e)}
+            finally:
+                self.current_client = None
+
+        if "id" not in request:
+            return None
+        if error:
+            return {"jsonrpc": "2.0", "id": request["id"], "error": error}
+        return {"jsonrpc": "2.0", "id": request["id"], "result": result}
+
+    def broadcast(self, store, event, params):
+        """Send a change of a store to every subscribed client"""
+        message = {"jsonrpc": "2.0", "method": "changed",
+                   "params": {"project": store.directory, "event": event, "params": params,
+                              "origin": self.current_client}}
+        for client, project in list(self.subscribers.items()):
+            if project is None or project == store.directory:
+                writer = self.writers[client]
+                if writer.transport.get_write_buffer_size() > DAEMON_MAX_BACKLOG:
+                    # The client stopped reading; drop it instead of buffering without limit
+                    del self.subscribers[client]
+                    writer.close()
+                else:
+                    self.send(writer, message)
+
+    @staticmethod
+    def send(writer, message):
+        writer.write(json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n")
+
+    async def handle_client(self, reader, writer):
+        """Serve one connection until it closes"""
+        import asyncio
+
+        client = self.next_client
+        self.next_client += 1
+        self.writers[client] = writer
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                response = self.handle_message(client, line)
+                if response is not None:
+                    self.send(writer, response)
+                await writer.drain()
+        except (ConnectionError, ValueError, asyncio.CancelledError):
+            # ValueError: a line longer than DAEMON_MAX_MESSAGE; cancelled on shutdown
+            pass
+        finally:
+            self.writers.pop(client, None)
+            self.subscribers.pop(client, None)
+            writer.close()
+
+    async def serve(self):
+        """Listen on the socket until SIGINT or SIGTERM"""
+        import signal
+        import socket
+        import asyncio
+
+        if os.path.exists(self.socket_path):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.socket_path)
+                raise DaemonError(f"A daemon is already listening on {self.socket_path}")
+            except OSError:
+                # Left over from a daemon that did not shut down cleanly
+                os.remove(self.socket_path)
+            finally:
+                probe.close()
+
+        # Create the socket private to this user from the start, not chmod it afterwards
+        umask = os.umask(0o077)
+        try:
+            server = await asyncio.start_unix_server(self.handle_client, self.socket_path,
+                                                     limit=DAEMON_MAX_MESSAGE)
+        finally:
+            os.umask(umask)
+
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, stop.set)
+
+        print(f"Serving {len(self.workspace.projects)} projects on {self.socket_path}")
+        try:
+            await stop.wait()
+        finally:
+            server.close()
+            # Closing the connections ends their handlers
+            for writer in list(self.writers.values()):
+                writer.close()
+            await server.wait_closed()
+            os.remove(self.socket_path)
+
+        for store in self.workspace.stores.values():
+            if store.dirty:
+                print(f"Warning: unsaved changes in {store.directory} were discarded")
+            store.save_memory()
+
+
+class DaemonClient:
+    """Blocking JSON-RPC client; notifications are queued for the caller to poll"""
+
+    def __init__(self, socket_path=DAEMON_SOCKET, timeout=DAEMON_TIMEOUT):
+        import queue
+        import socket
+        import threading
+
+        self.timeout = timeout
+        # The default path may be in a shared /tmp; only talk to a daemon of this user
+        if os.stat(socket_path).st_uid != os.getuid():
+            raise OSError(f"{socket_path} belongs to another user")
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(socket_path)
+        self.lock = threading.Lock()
+        self.pending = {}  # request id -> [event, response]
+        self.next_id = 1
+        self.notifications = queue.Queue()  # None once the connection is closed
+        self.connected = True
+
+        threading.Thread(target=self.read_responses, daemon=True).start()
+
+    def call(self, method, **params):
+        """Send a request and wait for its result"""
+        if not self.connected:
+            raise DaemonError("Not connected to the daemon")
+
+        import threading
+
+        waiter = [threading.Event(), None]
+        with self.lock:
+            request_id = self.next_id
+            self.next_id += 1
+            self.pending[request_id] = waiter
+            message = {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+            self.sock.sendall(json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n")
+
+        if not waiter[0].wait(self.timeout):
+            self.pending.pop(request_id, None)
+            raise DaemonError(f"No response to '{method}' from the daemon")
+        response = waiter[1]
+        if response is None:
+            raise DaemonError("Connection to the daemon was lost")
+        if "error" in response:
+            raise DaemonError(response["error"]["message"])
+        return response["result"]
+
+    def read_responses(self):
+        """Route responses to waiting calls and queue notifications"""
+        try:
+            for line in self.sock.makefile("rb"):
+                message = json.loads(line)
+                waiter = self.pending.pop(message.get("id"), None)
+                if waiter:
+                    waiter[1] = message
+                    waiter[0].set()
+                elif "method" in message:
+                    self.notifications.put(message)
+        except (OSError, ValueError):
+            pass
+
+        self.connected = False
+        for waiter in list(self.pending.values()):
+            waiter[0].set()
+        self.notifications.put(None)
+
+    def close(self):
+        import socket
+
+        # The reader thread's file object keeps the socket open, so shut the connection down first
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+
+
+class TranslatorApp:
+    def __init__(self, root, directories=None, client=None, startup_report=False, started=None):
+        self.root = root
+        self.root.title("Laravel Translator - Enhanced")
+        self.root.geometry("1200x700")
+
+        # Data storage; an empty store stands in until the first project is loaded
+        self.workspace = Workspace()
+        self.directories = [os.path.abspath(d) for d in directories or []]
+        self.store = TranslationStore(self.directories[0] if self.directories else os.getcwd())
+        self.reported_errors = set()  # projects whose load errors were shown
+        self.filtered_data = {}
+        self.filtered_extra_keys = set()  # used but undefined keys shown as rows
+        self.sort_spec = ("key",)  # see SortIndex
+        self.sort_descending = False
+        self.scan_thread = None
+        self.client = client  # DaemonClient when attached to a daemon
+        self.client_id = None
+        self.muted = False    # set while replaying changes received from the daemon
+        self.background_loads = 0  # projects being loaded in threads
+        self.memory_waiters = {}   # store -> callbacks waiting for its translation memory
+        self.out_of_sync = set()   # stores with a local edit the daemon did not accept
+        self.current_search = ""
+        self.auto_save = tk.BooleanVar(value=True)
+
+        # Rows still to be inserted into the table
+        self.pending_rows = iter(())
+        self.render_job = None
+
+        # Startup measurements in milliseconds since started, taken by the launcher before any import
+        self.startup_report = startup_report
+        self.started = started or time.perf_counter()
+        self.startup_times = {}
+
+        # Create menu
+        self.create_menu()
+
+        # Create main interface
+        self.create_search_frame()
+        self.create_table()
+        self.create_buttons()
+        self.create_status_bar()
+
+        # Bind keyboard shortcuts
+        self.setup_keyboard_shortcuts()
+
+        self.root.protocol("WM_DELETE_WINDOW", self.quit)
+
+        # Show the empty window first; files are loaded once it is on screen
+        self.status_label.config(text="Loading translation files...")
+        self.root.bind("<Expose>", self.on_first_paint)
+
+    def mark_startup(self, phase):
+        self.startup_times[phase] = (time.perf_counter() - self.started) * 1000
+
+    def on_first_paint(self, event):
+        """Start loading once Tk has drawn the window"""
+        self.root.unbind("<Expose>")
+        self.mark_startup("first paint")
+        # Idle callbacks run after the pending redraws, so the frame is complete
+        self.root.after_idle(self.load_projects)
+
+    def load_projects(self):
+        """Load the first project and stream its rows in; other projects follow"""
+        # Attached to a daemon, projects come from its warm workspace instead of disk
+        if self.client:
+            self.client_id = self.client.call("subscribe")["client"]
+            self.workspace.loader = self.load_from_daemon
+            self.directories = self.directories or [project["project"]
+                                                    for project in self.client.call("projects")]
+            self.root.after(DAEMON_POLL_INTERVAL, self.poll_daemon)
+
+        for directory in self.directories or [os.getcwd()]:
+            self.workspace.add(directory)
+        self.load_in_background(self.workspace.projects[0], self.first_project_loaded)
+
+    def first_project_loaded(self, store, error):
+        """Show the first project and stream its rows in"""
+        self.store = self.workspace.adopt(store)
+        self.mark_startup("files loaded")
+
+        self.load_files(reload=False)
+        self.reported_errors.add(self.store.directory)
+        self.update_workspace_menu()
+        self.refresh_search()
+
+    def rows_rendered(self):
+        """Called whenever the table is complete; ends the startup once files are loaded"""
+        if "files loaded" in self.startup_times and "rows rendered" not in self.startup_times:
+            self.finish_startup()
+
+    def finish_startup(self):
+        """Report the startup phases and warm up the remaining projects"""
+        self.mark_startup("rows rendered")
+        if self.startup_report:
+            first_paint = self.startup_times["first paint"]
+            verdict = "within" if first_paint <= STARTUP_TARGET_MS else "over"
+            print(f"Startup: first paint {first_paint:.0f} ms ({verdict} the {STARTUP_TARGET_MS} ms target), "
+                  f"files loaded {self.startup_times['files loaded']:.0f} ms, "
+                  f"{len(self.tree.get_children())} rows rendered {self.startup_times['rows rendered']:.0f} ms",
+                  file=sys.stderr)
+        self.warm_up(self.workspace.projects[1:])
+
+    def warm_up(self, directories):
+        """Load the other projects one after another so switching to them is instant"""
+        directories = [directory for directory in directories if directory not in self.workspace.stores]
+        if directories:
+            self.load_in_background(directories[0], lambda store, error: self.project_warmed_up(
+                store, error, directories[1:]))
+
+    def project_warmed_up(self, store, error, directories):
+        if not error and store.directory in self.workspace.projects:
+            self.workspace.adopt(store, activate=False)
+        self.warm_up(directories)
+
+    def load_memory(self, store, callback):
+        """Build the translation memory of store in a thread, then call callback()"""
+        if store in self.memory_waiters:
+            self.memory_waiters[store].append(callback)
+            return
+        self.memory_waiters[store] = [callback]
+        arguments = store.start_memory()
+        result = {}
+
+        def run():
+            try:
+                result["memory"] = store.build_memory(*arguments)
+            except Exception as e:
+                result["error"] = e
+
+        import threading
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        self.root.after(BACKGROUND_POLL_INTERVAL, self.finish_memory, thread, store, result)
+
+    def finish_memory(self, thread, store, result):
+        """Install a memory built in a thread and run the callbacks waiting for it"""
+        if thread.is_alive():
+            self.root.after(BACKGROUND_POLL_INTERVAL, self.finish_memory, thread, store, result)
+            return
+
+        callbacks = self.memory_waiters.pop(store)
+        if "error" in result:
+            messagebox.showerror("Error", f"Failed to build the translation memory: {str(result['error'])}")
+            return
+        store.finish_memory(*result["memory"])
+        for callback in callbacks:
+            callback()
+
+    def quit(self):
+        """Keep the translation memories for the next session and exit"""
+        for store in self.workspace.stores.values():
+            store.save_memory()
+        self.root.quit()
+
+    def load_in_background(self, directory, callback):
+        """Load a project in a thread, then call callback(store, error) on the Tk thread
+
+        Parsing, indexing and validating a large project takes seconds; in a thread the
+        window keeps redrawing and handling input meanwhile.
+        """
+        import threading
+
+        store = TranslationStore(directory)
+        result = {}
+
+        def run():
+            try:
+                self.workspace.load(store)
+                store.estimated_size()  # cached, so the eviction check on adoption is quick
+            except Exception as e:
+                result["error"] = e
+
+        thread = threading.Thread(target=run, daemon=True)
+        self.background_loads += 1
+        thread.start()
+        self.root.after(BACKGROUND_POLL_INTERVAL, self.finish_background_load, thread, store, result, callback)
+
+    def finish_background_load(self, thread, store, result, callback):
+        """Hand a store loaded in a thread to its callback once the thread is done"""
+        if thread.is_alive():
+            self.root.after(BACKGROUND_POLL_INTERVAL, self.finish_background_load, thread, store, result, callback)
+            return
+
+        self.background_loads -= 1
+        error = result.get("error")
+        if error:
+            messagebox.showerror("Error", f"Failed to load {store.directory}: {str(error)}")
+        callback(store, error)
+
+    def create_menu(self):
+        """Create application menu bar"""
+        menubar = tk.Menu(self.root)
+        self.root.config(menu=menubar)
+
+        # File menu
+        file_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="File", menu=file_menu)
+        file_menu.add_command(label="Save All (Ctrl+S)", command=self.save_files)
+        file_menu.add_command(label="Reload Files", command=self.reload_files)
+        file_menu.add_separator()
+        file_menu.add_checkbutton(label="Auto-save", variable=self.auto_save)
+        file_menu.add_separator()
+        file_menu.add_command(label="Exit", command=self.quit)
+
+        # Edit menu
+        edit_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Edit", menu=edit_menu)
+        edit_menu.add_command(label="Search (Ctrl+F)", command=self.focus_search)
+        edit_menu.add_command(label="Add Key (Ctrl+N)", command=self.add_key)
+        edit_menu.add_command(label="Clear Search", command=self.clear_search)
+
+        # View menu
+        view_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="View", menu=view_menu)
+        view_menu.add_command(label="Sort by Key", command=lambda: self.sort_by(("key",)))
+        view_menu.add_command(label="Sort by Missing Translations", command=lambda: self.sort_by(("missing",)))
+        view_menu.add_command(label="Reverse Sort Order", command=lambda: self.sort_by(self.sort_spec))
+        view_menu.add_separator()
+        view_menu.add_command(label="Click a header to sort, Shift+click a language to sort by length",
+                              state="disabled")
+
+        # Language menu
+        lang_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Language", menu=lang_menu)
+        lang_menu.add_command(label="Add Language", command=self.add_language)
+        lang_menu.add_command(label="Remove Language", command=self.remove_language)
+        lang_menu.add_command(label="Set Source Language...", command=self.choose_source_language)
+
+        # Tools menu
+        tools_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Tools", menu=tools_menu)
+        tools_menu.add_command(label="Find Duplicates...", command=self.find_duplicates)
+        tools_menu.add_separator()
+        tools_menu.add_command(label="Scan Source Usage", command=self.scan_usage)
+        tools_menu.add_command(label="Add Missing Keys...", command=self.add_missing_keys)
+        tools_menu.add_separator()
+        tools_menu.add_command(label="Record Baseline", command=self.record_baseline)
+        tools_menu.add_command(label="Import Baseline from Git...", command=self.import_baseline)
+        tools_menu.add_command(label="Clear Baseline", command=self.clear_baseline)
+
+        # Workspace menu
+        self.workspace_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Workspace", menu=self.workspace_menu)
+        self.project_var = tk.StringVar()
+
+    @property
+    def data(self):
+        """Translations of the active project: {file name: {key: value}}"""
+        return self.store.data if self.store else {}
+
+    def update_workspace_menu(self):
+        """Rebuild the Workspace menu with the list of open projects"""
+        menu = self.workspace_menu
+        menu.delete(0, tk.END)
+        menu.add_command(label="Open Project...", command=self.open_project)
+        menu.add_command(label="Close Project", command=self.close_project)
+        menu.add_command(label="Search All Projects...", command=self.search_workspace)
+        menu.add_separator()
+
+        self.project_var.set(self.store.directory)
+        for directory in self.workspace.projects:
+            menu.add_radiobutton(label=directory, variable=self.project_var, value=directory,
+                                 command=lambda d=directory: self.switch_project(d))
+
+        title = f"Laravel Translator - Enhanced - {self.store.name}"
+        self.root.title(title + " (daemon)" if self.client else title)
+
+    def load_from_daemon(self, store):
+        """Fill a store from the daemon's copy and send its edits back"""
+        snapshot = self.client.call("dump", project=store.directory)
+        store.replace_data(snapshot["data"], snapshot["source_lang"], snapshot["dirty"])
+        if self.forward_change not in store.listeners:
+            store.listeners.append(self.forward_change)
+
+    def forward_change(self, store, event, params):
+        """Send a local edit to the daemon"""
+        if self.muted or not self.client or store in self.out_of_sync:
+            return
+        try:
+            self.client.call(event, project=store.directory, **params)
+        except DaemonError as e:
+            # The edit is only local now; take the daemon's copy once the current edit is done
+            self.out_of_sync.add(store)
+            messagebox.showerror("Error", f"Failed to send change to the daemon: {str(e)}\n\n"
+                                          "The project is reloaded from the daemon.")
+            self.root.after_idle(self.resync, store)
+
+    def resync(self, store):
+        """Replace a store's data with the daemon's copy after an edit could not be sent"""
+        self.out_of_sync.discard(store)
+        if not self.client:
+            # Detached meanwhile; the local copy is the only one left
+            return
+        try:
+            self.workspace.load(store)
+        except DaemonError as e:
+            messagebox.showwarning("Warning", f"Failed to reload from the daemon: {str(e)}\n\n"
+                                              "Changes are now saved to the files directly.")
+            self.detach_daemon()
+            return
+        if store is self.store:
+            self.update_table_headers()
+            self.refresh_search()
+
+    def poll_daemon(self):
+        """Apply the changes other clients made through the daemon"""
+        if not self.client:
+            return
+        if self.background_loads:
+            # Keep the changes queued until the stores they apply to are in the workspace
+            self.root.after(DAEMON_POLL_INTERVAL, self.poll_daemon)
+            return
+
+        refresh = False
+        while True:
+            if self.client.notifications.empty():
+                break
+            message = self.client.notifications.get_nowait()
+            if message is None:
+                self.detach_daemon()
+                messagebox.showwarning("Warning", "Lost connection to the daemon. "
+                                                  "Changes are now saved to the files directly.")
+                return
+
+            change = message["params"]
+            store = self.workspace.stores.get(change["project"])
+            if store is None or change["origin"] == self.client_id:
+                continue
+            if change["event"] == "saved":
+                store.dirty = False
+            elif change["event"] == "reloaded":
+                self.workspace.load(store)
+            elif change["event"] in STORE_MUTATIONS:
+                self.muted = True
+                try:
+                    getattr(store, change["event"])(**change["params"])
+                finally:
+                    self.muted = False
+            refresh = refresh or store is self.store
+
+        if refresh:
+            selection = self.tree.selection()
+            selected_key = str(self.tree.item(selection[0], "values")[0]) if selection else None
+            self.update_table_headers()
+            self.refresh_search()
+            self.finish_rendering()
+            for item in self.tree.get_children() if selected_key else ():
+                if str(self.tree.item(item, "values")[0]) == selected_key:
+                    self.tree.selection_set(item)
+                    break
+
+        self.root.after(DAEMON_POLL_INTERVAL, self.poll_daemon)
+
+    def detach_daemon(self):
+        """Continue standalone with the data received so far"""
+        self.client = None
+        self.workspace.loader = None
+        for store in self.workspace.stores.values():
+            if self.forward_change in store.listeners:
+                store.listeners.remove(self.forward_change)
+        self.update_workspace_menu()
+
+    def open_project(self):
+        """Open another lang directory in the workspace"""
+        from tkinter import filedialog
+
+        directory = filedialog.askdirectory(title="Open lang directory", mustexist=True)
+        if directory:
+            self.switch_project(directory)
+
+    def close_project(self):
+        """Close the active project and switch to the next open one"""
+        if len(self.workspace.projects) < 2:
+            messagebox.showwarning("Warning", "Cannot close the only open project.")
+            return
+        if self.store.dirty and not messagebox.askyesno(
+                "Close Project", "This will discard any unsaved changes. Continue?"):
+            return
+
+        self.workspace.close(self.store.directory)
+        self.switch_project(self.workspace.projects[0])
+
+    def switch_project(self, directory):
+        """Make another project active; warm projects switch without reloading"""
+        self.store = self.workspace.open(directory)
+        if self.store.directory not in self.reported_errors:
+            self.reported_errors.add(self.store.directory)
+            self.show_load_errors()
+        self.update_table_headers()
+        self.refresh_search()
+        self.update_workspace_menu()
+
+    def search_workspace(self):
+        """Search keys and values across all open projects"""
+        WorkspaceSearchWindow(self)
+
+    def select_key(self, key):
+        """Select and show the row of a key, clearing the search if it hides it"""
+        if not any(key in translations for translations in self.filtered_data.values()):
+            self.search_var.set("")
+        self.finish_rendering()
+        for item in self.tree.get_children():
+            if str(self.tree.item(item, "values")[0]) == key:
+                self.tree.selection_set(item)
+                self.tree.focus(item)
+                self.tree.see(item)
+                break
+
+    def create_search_frame(self):
+        """Create search interface"""
+        search_frame = tk.Frame(self.root)
+        search_frame.pack(fill="x", padx=5, pady=5)
+
+        tk.Label(search_frame, text="Search:", font=("Arial", 10, "bold")).pack(side="left")
+
+        self.search_var = tk.StringVar()
+        self.search_var.trace("w", self.on_search_change)
+
+        self.search_entry = tk.Entry(search_frame, textvariable=self.search_var, width=50)
+        self.search_entry.pack(side="left", padx=(5, 10), fill="x", expand=True)
+
+        # Add Ctrl+A support for search entry
+        self.search_entry.bind("<Control-a>", self.select_all_entry)
+
+        tk.Button(search_frame, text="Clear", command=self.clear_search).pack(side="right", padx=5)
+
+        # Search options
+        options_frame = tk.Frame(search_frame)
+        options_frame.pack(side="right")
+
+        self.search_keys = tk.BooleanVar(value=True)
+        self.search_values = tk.BooleanVar(value=True)
+
+        tk.Checkbutton(options_frame, text="Keys", variable=self.search_keys,
+                      command=self.refresh_search).pack(side="left")
+        tk.Checkbutton(options_frame, text="Values", variable=self.search_values,
+                      command=self.refresh_search).pack(side="left")
+
+        tk.Label(options_frame, text="Show:").pack(side="left", padx=(10, 0))
+        self.show_var = tk.StringVar(value=SHOW_ALL)
+        show_box = ttk.Combobox(options_frame, textvariable=self.show_var, values=SHOW_FILTERS,
+                                state="readonly", width=18)
+        show_box.pack(side="left", padx=5)
+        show_box.bind("<<ComboboxSelected>>", self.on_show_change)
+
+    def setup_keyboard_shortcuts(self):
+        """Setup keyboard shortcuts"""
+        # Global shortcuts
+        self.root.bind("<Control-s>", lambda e: self.save_files())
+        self.root.bind("<Control-f>", lambda e: self.focus_search())
+        self.root.bind("<Control-n>", lambda e: self.add_key())
+        self.root.bind("<Escape>", lambda e: self.clear_search())
+        self.root.bind("<F5>", lambda e: self.reload_files())
+
+        # Search shortcuts
+        self.search_entry.bind("<Return>", lambda e: self.tree.focus())
+        self.search_entry.bind("<Down>", lambda e: self.tree.focus())
+
+        # Table shortcuts
+        self.tree.bind("<Return>", self.on_enter_key)
+        self.tree.bind("<Delete>", self.on_delete_key)
+        self.tree.bind("<Key>", self.jump_to_key)
+
+    def focus_search(self):
+        """Focus on search entry"""
+        self.search_entry.focus()
+        self.search_entry.select_range(0, tk.END)
+
+    def select_all_entry(self, event):
+        """Select all text in Entry widget"""
+        event.widget.select_range(0, tk.END)
+        return "break"  # Prevent default behavior
+
+    def select_all_text(self, event):
+        """Select all text in Text widget"""
+        event.widget.tag_add(tk.SEL, "1.0", tk.END)
+        event.widget.mark_set(tk.INSERT, "1.0")
+        event.widget.see(tk.INSERT)
+        return "break"  # Prevent default behavior
+
+    def clear_search(self):
+        """Clear search and refresh table"""
+        self.search_var.set("")
+        self.search_entry.focus()
+
+    def on_search_change(self, *args):
+        """Handle search text changes"""
+        self.current_search = self.search_var.get().lower()
+        self.refresh_search()
+
+    def refresh_search(self):
+        """Refresh search results"""
+        self.refresh_filtered_data()
+        self.refresh_table()
+        self.update_status()
+
+    def on_show_change(self, event=None):
+        """Handle Show filter changes, scanning the source code if needed"""
+        if self.show_var.get() in (SHOW_UNUSED, SHOW_UNDEFINED) and self.store.usage is None:
+            self.scan_usage()
+        if self.show_var.get() == SHOW_CHANGED and self.store.baseline is None:
+            # Default to the current last commit, without remembering it for later sessions
+            try:
+                self.store.import_baseline(persist=False)
+            except ValueError as e:
+                messagebox.showinfo("Info", f"No baseline recorded and the last commit could not be read:\n{str(e)}"
+                                            "\n\nUse Tools > Record Baseline to take a snapshot.")
+                self.show_var.set(SHOW_ALL)
+        self.refresh_search()
+
+    def refresh_filtered_data(self):
+        """Filter data based on search criteria and the Show filter"""
+        show = self.show_var.get()
+        self.filtered_extra_keys = set()
+        if not self.current_search and show == SHOW_ALL:
+            self.filtered_data = self.data.copy()
+            return
+
+        self.filtered_data = {}
+        for lang in self.data:
+            self.filtered_data[lang] = {}
+
+        # Get all keys that match search criteria
+        if self.current_search:
+            matching_keys = self.store.index.search(self.current_search,
+                                                    self.search_keys.get(), self.search_values.get())
+        else:
+            matching_keys = self.store.all_keys()
+
+        if show == SHOW_UNUSED:
+            matching_keys &= self.store.unused_keys()
+        elif show == SHOW_INVALID:
+            matching_keys &= set(self.store.violations)
+        elif show == SHOW_UNDEFINED:
+            # Undefined keys have no values, so only the key itself can match
+            self.filtered_extra_keys = {key for key in self.store.undefined_keys()
+                                        if not self.current_search or self.current_search in key.lower()}
+            matching_keys = set()
+        elif show == SHOW_CHANGED:
+            matching_keys &= set(self.store.changes)
+            # Removed keys are only in the baseline, so only the key itself can match
+            self.filtered_extra_keys = {key for key in self.store.changes if not self.store.has_key(key)
+                                        and (not self.current_search or self.current_search in key.lower())}
+
+        # Add matching keys to filtered data
+        for key in matching_keys:
+            for lang in self.data:
+                if key in self.data[lang]:
+                    self.filtered_data[lang][key] = self.data[lang][key]
+
+    def load_files(self, reload=True):
+        """Load all JSON translation files of the active project"""
+        if reload:
+            try:
+                if self.client:
+                    self.client.call("reload", project=self.store.directory)
+                self.workspace.load(self.store)
+            except DaemonError as e:
+                messagebox.showerror("Error", f"Failed to reload from the daemon: {str(e)}")
+                return
+
+        if not self.data:
+            messagebox.showinfo("Info", f"No JSON files found in {self.store.directory}.")
+            # Initialize with empty data but still update headers
+            self.update_table_headers()
+            return
+
+        self.show_load_errors()
+        self.update_table_headers()
+
+    def show_load_errors(self):
+        """Report files of the active project that failed to parse"""
+        for file_name, error in self.store.errors:
+            messagebox.showerror("Error", f"Failed to load file: {file_name}\nError: {error}")
+
+    def reload_files(self):
+        """Reload all files from disk"""
+        if messagebox.askyesno("Reload Files", "This will discard any unsaved changes. Continue?"):
+            self.load_files()
+            self.refresh_filtered_data()
+            self.refresh_table()
+            self.update_status()
+            messagebox.showinfo("Success", "Files reloaded successfully.")
+
+    def clean_json(self, json_text):
+        """Clean JSON text by removing trailing commas"""
+        return TranslationStore.clean_json(json_text)
+
+    def create_table(self):
+        """Create the main translation table"""
+        # Create frame for table and scrollbars
+        table_frame = tk.Frame(self.root)
+        table_frame.pack(fill="both", expand=True, padx=5, pady=5)
+
+        # Create treeview with scrollbars
+        self.tree = ttk.Treeview(table_frame, show="headings", height=20)
+
+        # Scrollbars
+        v_scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=self.tree.yview)
+        h_scrollbar = ttk.Scrollbar(table_frame, orient="horizontal", command=self.tree.xview)
+
+        self.tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+
+        # Pack scrollbars and treeview
+        v_scrollbar.pack(side="right", fill="y")
+        h_scrollbar.pack(side="bottom", fill="x")
+        self.tree.pack(fill="both", expand=True)
+
+        # Configure column widths
+        self.tree.bind("<Double-1>", self.on_double_click)
+        self.tree.bind("<<TreeviewSelect>>", self.on_select)
+        self.tree.bind("<Shift-Button-1>", self.on_shift_click)
+
+        # Configure tags for better visual feedback
+        self.tree.tag_configure("missing", background="#ffeeee")
+        self.tree.tag_configure("complete", background="#eeffee")
+        self.tree.tag_configure("unused", foreground="#888888")
+        self.tree.tag_configure("undefined", background="#fff8dc")
+        self.tree.tag_configure("invalid", foreground="#cc0000")
+
+    def update_table_headers(self):
+        """Update table column headers"""
+        columns = ("Key",) + tuple(sorted(self.data.keys()))
+        # Number of source files using each key, once the project was scanned
+        if self.store and self.store.usage is not None:
+            columns += ("Usage",)
+
+        # Setting the columns resets all widths, so only do it when they changed
+        # and keep the widths the user gave the remaining columns
+        if columns != tuple(self.tree["columns"]):
+            widths = {col: self.tree.column(col, "width") for col in self.tree["columns"]}
+            self.tree["columns"] = columns
+            for col in columns:
+                if col == "Usage":
+                    self.tree.column(col, width=widths.get(col, 60), minwidth=50, stretch=False, anchor="e")
+                else:
+                    self.tree.column(col, width=widths.get(col, 200), minwidth=150)
+        self.update_sort_headings()
+
+    def update_sort_headings(self):
+        """Show the sorted column and direction in the headings"""
+        # Fall back to sorting by key when the sorted column is gone
+        if (self.sort_spec[0] in ("value", "length") and self.sort_spec[1] not in self.data) or \
+                (self.sort_spec[0] == "usage" and "Usage" not in self.tree["columns"]):
+            self.sort_spec = ("key",)
+            self.sort_descending = False
+
+        arrow = " ▼" if self.sort_descending else " ▲"
+        sorted_col = {"key": "Key", "missing": "Key", "usage": "Usage"}.get(self.sort_spec[0]) or self.sort_spec[1]
+        for col in self.tree["columns"]:
+            text = col.replace('.json', '')
+            if col == sorted_col:
+                text += {"missing": " (missing)", "length": " (length)"}.get(self.sort_spec[0], "") + arrow
+            self.tree.heading(col, text=text, command=lambda c=col: self.sort_by_column(c))
+
+    def refresh_table(self):
+        """Refresh the translation table
+
+        The first rows are inserted right away and the rest stream in through
+        the event loop, so the window stays responsive on large catalogues.
+        """
+        # Clear existing items
+        if self.render_job:
+            self.root.after_cancel(self.render_job)
+            self.render_job = None
+        self.pending_rows = iter(())
+        items = self.tree.get_children()
+        if items:
+            self.tree.delete(*items)
+
+        if not self.filtered_data:
+            self.rows_rendered()
+            return
+
+        # Get all unique keys from filtered data
+        all_keys = set(self.filtered_extra_keys)
+        for lang_data in self.filtered_data.values():
+            all_keys.update(lang_data.keys())
+
+        # Walk the cached sort order and keep the filtered keys, instead of sorting
+        order = self.store.sorts.order(self.sort_spec)
+        if self.sort_descending:
+            order = reversed(order)
+        extra_keys = sorted(self.filtered_extra_keys, key=str.lower, reverse=self.sort_descending)
+        sorted_keys = itertools.chain(extra_keys, (key for _, key in order if key in all_keys))
+        languages = self.store.languages()
+
+        # Add rows to table
+        self.pending_rows = (self.table_row(key, languages) for key in sorted_keys)
+        self.render_rows()
+
+    def sort_by_column(self, col):
+        """Sort by a clicked column header"""
+        if col == "Key":
+            self.sort_by(("key",))
+        elif col == "Usage":
+            self.sort_by(("usage",))
+        else:
+            self.sort_by(("value", col))
+
+    def on_shift_click(self, event):
+        """Sort by value length when a language header is Shift+clicked"""
+        if self.tree.identify_region(event.x, event.y) != "heading":
+            return None
+        col = self.tree.column(self.tree.identify_column(event.x), "id")
+        if col in self.data:
+            self.sort_by(("length", col))
+        return "break"
+
+    def sort_by(self, spec):
+        """Sort the table by spec; choosing the current sort again reverses it"""
+        if spec == self.sort_spec:
+            self.sort_descending = not self.sort_descending
+        else:
+            self.sort_spec = spec
+            # Counts and lengths are most useful largest first
+            self.sort_descending = spec[0] in ("missing", "usage", "length")
+        self.update_sort_headings()
+        self.refresh_table()
+
+    def table_row(self, key, languages):
+        """Return the values and tags of a key's row"""
+        values = [key]
+        missing_count = 0
+
+        # Change markers only in the Changed view, other views show the plain values
+        changes = self.store.changes.get(key, {}) if self.show_var.get() == SHOW_CHANGED else {}
+
+        for lang in languages:
+            value = self.filtered_data.get(lang, {}).get(key, "")
+            if not value:
+                missing_count += 1
+            if lang in changes:
+                value = f"[{changes[lang]}] {value}".rstrip()
+            values.append(value)
+
+        # Determine row tag based on completion status
+        if missing_count == 0:
+            tag = "complete"
+        elif missing_count == len(languages):
+            tag = "missing"
+        else:
+            tag = ""
+        tags = (tag,)
+        if key in self.store.violations:
+            tags += ("invalid",)
+
+        usage = self.store.usage
+        if usage is not None:
+            values.append(len(usage.get(key, ())))
+            if key in usage and not self.store.has_key(key):
+                tags = ("undefined",)
+            elif key not in usage:
+                tags += ("unused",)
+
+        return values, tags
+
+    def render_rows(self, limit=TABLE_CHUNK_ROWS):
+        """Insert the next chunk of rows, scheduling the rest; limit=None inserts all"""
+        self.render_job = None
+        inserted = 0
+        for values, tags in itertools.islice(self.pending_rows, limit):
+            self.tree.insert("", "end", values=values, tags=tags)
+            inserted += 1
+
+        if inserted == limit:
+            self.render_job = self.root.after(1, self.render_rows)
+        else:
+            self.rows_rendered()
+
+    def finish_rendering(self):
+        """Insert the rows that are still streaming in"""
+        if self.render_job:
+            self.root.after_cancel(self.render_job)
+            self.render_rows(limit=None)
+
+    def on_double_click(self, event):
+        """Handle double-click on table row"""
+        selection = self.tree.selection()
+        if selection:
+            item_id = selection[0]
+            key = str(self.tree.item(item_id, "values")[0])
+            if not self.store.has_key(key):
+                return
+            # Take the values from the store, the cells may carry change markers
+            EditWindow(self, key, self.store.values_of(key))
+
+    def on_select(self, event):
+        """Show the consistency problems of the selected key in the status bar"""
+        selection = self.tree.selection()
+        if not selection:
+            return
+        key = str(self.tree.item(selection[0], "values")[0])
+        violations = self.store.violations.get(key)
+        if violations:
+            self.status_label.config(text=f"{key}: " + format_violations(violations))
+        else:
+            self.update_status()
+
+    def confirm_consistency(self, key, new_values):
+        """Warn before saving {lang: value} whose placeholders or markup differ from the source"""
+        # Languages removed since the dialog opened are not saved
+        values = {lang: value for lang, value in new_values.items() if lang in self.data}
+        violations = validate_key(values, self.store.source_lang)
+        if not violations:
+            return True
+        return messagebox.askyesno(
+            "Inconsistent Translation",
+            f"The translations of '{key}' do not match the source language:\n\n"
+            f"{format_violations(violations, separator=chr(10))}\n\nSave anyway?")
+
+    def on_enter_key(self, event):
+        """Handle Enter key press in table"""
+        selection = self.tree.selection()
+        if selection:
+            self.on_double_click(event)
+
+    def on_delete_key(self, event):
+        """Handle Delete key press in table"""
+        selection = self.tree.selection()
+        if selection:
+            item_id = selection[0]
+            key = self.tree.item(item_id, "values")[0]
+            if messagebox.askyesno("Delete Key", f"Are you sure you want to delete key '{key}'?"):
+                self.delete_key(key)
+
+    def delete_key(self, key):
+        """Delete a translation key"""
+        self.store.delete_key(key)
+
+        if self.auto_save.get():
+            self.save_files(show_message=False)
+
+        self.refresh_filtered_data()
+        self.refresh_table()
+        self.update_status()
+
+    def update_value(self, old_key, new_key, new_values):
+        """Update translation values from {lang: value}; return False if the user cancelled"""
+        if not self.store.has_key(old_key):
+            # Renamed or deleted by another client while the key was being edited
+            if not messagebox.askyesno("Key Changed", f"The key '{old_key}' was renamed or deleted "
+                                                      f"in the meantime. Save your values as '{new_key}'?"):
+                return False
+        elif old_key != new_key:
+            # Handle key rename
+            self.store.rename_key(old_key, new_key)
+
+        # Update values; other clients may have added or removed languages meanwhile
+        for lang, value in new_values.items():
+            if lang not in self.data:
+                continue
+            value = value.strip()
+            if value:
+                self.store.set_value(lang, new_key, value)
+            else:
+                self.store.discard_value(lang, new_key)
+
+        if self.auto_save.get():
+            self.save_files(show_message=False)
+
+        self.refresh_filtered_data()
+        self.refresh_table()
+        self.update_status()
+        return True
+
+    def create_buttons(self):
+        """Create action buttons"""
+        button_frame = tk.Frame(self.root)
+        button_frame.pack(pady=10)
+
+        # Main action buttons
+        tk.Button(button_frame, text="Add Language", command=self.add_language,
+                 width=12).pack(side="left", padx=5)
+        tk.Button(button_frame, text="Remove Language", command=self.remove_language,
+                 width=12).pack(side="left", padx=5)
+        tk.Button(button_frame, text="Add Key (Ctrl+N)", command=self.add_key,
+                 width=15).pack(side="left", padx=5)
+        tk.Button(button_frame, text="Save All (Ctrl+S)", command=self.save_files,
+                 width=15, bg="#4CAF50", fg="white", font=("Arial", 9, "bold")).pack(side="left", padx=5)
+
+    def create_status_bar(self):
+        """Create status bar"""
+        self.status_frame = tk.Frame(self.root, relief=tk.SUNKEN, bd=1)
+        self.status_frame.pack(side="bottom", fill="x")
+
+        self.status_label = tk.Label(self.status_frame, text="Ready", anchor="w")
+        self.status_label.pack(side="left", padx=5)
+
+        self.update_status()
+
+    def update_status(self):
+        """Update status bar information"""
+        if not self.data:
+            self.status_label.config(text="No translation files loaded")
+            return
+
+        total_keys = len(self.store.index.keys)
+        filtered_keys = len(set(key for lang in self.filtered_data.values() for key in lang.keys())
+                            | self.filtered_extra_keys)
+        languages = len(self.data)
+
+        if self.current_search:
+            status_text = f"Languages: {languages} | Keys: {filtered_keys}/{total_keys} (filtered) | Search: '{self.current_search}'"
+        elif self.show_var.get() != SHOW_ALL:
+            status_text = f"Languages: {languages} | Keys: {filtered_keys}/{total_keys} (filtered)"
+        else:
+            status_text = f"Languages: {languages} | Keys: {total_keys}"
+
+        if self.store.usage is not None:
+            status_text += (f" | Unused: {len(self.store.unused_keys())}"
+                            f" | Undefined: {len(self.store.undefined_keys())}")
+        if self.store.violations:
+            status_text += f" | Inconsistent: {len(self.store.violations)}"
+        if self.store.baseline is not None:
+            status_text += f" | Changed since {self.store.baseline.label}: {len(self.store.changes)}"
+
+        self.status_label.config(text=status_text)
+
+    def add_key(self):
+        """Add new translation key"""
+        AddKeyWindow(self)
+
+    def add_language(self):
+        """Add new language file"""
+        dialog = LanguageDialog(self.root, "Add Language", "Enter language file name (e.g., fr.json):")
+        if dialog.result:
+            lang_name = dialog.result
+            if not lang_name.endswith(".json"):
+                lang_name += ".json"
+
+            if lang_name in self.data:
+                messagebox.showerror("Error", "Language file already exists.")
+                return
+
+            self.store.add_language(lang_name)
+            self.update_table_headers()
+            self.refresh_filtered_data()
+            self.refresh_table()
+            self.update_status()
+
+            if self.auto_save.get():
+                self.save_files(show_message=False)
+
+    def remove_language(self):
+        """Remove language file"""
+        if not self.data:
+            messagebox.showwarning("Warning", "No languages to remove.")
+            return
+
+        dialog = LanguageSelectionDialog(self.root, "Remove Language",
+                                       "Select language to remove:", list(self.data.keys()))
+        if dialog.result:
+            lang_name = dialog.result
+            if messagebox.askyesno("Confirm", f"Are you sure you want to remove '{lang_name}'?"):
+                self.store.remove_language(lang_name)
+
+                self.update_table_headers()
+                self.refresh_filtered_data()
+                self.refresh_table()
+                self.update_status()
+
+    def choose_source_language(self):
+        """Select the language whose values are the source text"""
+        if not self.data:
+            messagebox.showwarning("Warning", "No languages available.")
+            return
+
+        dialog = LanguageSelectionDialog(self.root, "Source Language",
+                                         f"Select source language (current: {self.store.source_lang}):",
+                                         self.store.languages())
+        if dialog.result:
+            self.store.change_source_language(dialog.result)
+            self.update_table_headers()
+            self.refresh_search()
+
+    def record_baseline(self):
+        """Mark changes against the current values from now on"""
+        self.store.record_baseline()
+        self.refresh_search()
+
+    def import_baseline(self):
+        """Mark changes against the lang files of a git revision"""
+        dialog = LanguageDialog(self.root, "Import Baseline", "Git revision (e.g. HEAD, main, v1.2):")
+        if not dialog.result:
+            return
+        try:
+            self.store.import_baseline(dialog.result)
+        except ValueError as e:
+            messagebox.showerror("Error", f"Failed to import baseline: {str(e)}")
+            return
+        self.refresh_search()
+
+    def clear_baseline(self):
+        """Stop marking changes against a baseline"""
+        self.store.clear_baseline()
+        if self.show_var.get() == SHOW_CHANGED:
+            self.show_var.set(SHOW_ALL)
+        self.refresh_search()
+
+    def find_duplicates(self):
+        """Show keys sharing a source value and their diverging translations"""
+        DuplicatesWindow(self)
+
+    def scan_usage(self):
+        """Scan the project's source code for used keys in a background thread"""
+        if self.scan_thread and self.scan_thread.is_alive():
+            return
+
+        store = self.store
+        scanner = UsageScanner(store.directory)
+        result = {}
+
+        def run():
+            try:
+                result["usage"] = scanner.scan()
+            except Exception as e:
+                result["error"] = e
+
+        self.status_label.config(text=f"Scanning source code in {scanner.root}...")
+        import threading
+
+        self.scan_thread = threading.Thread(target=run, daemon=True)
+        self.scan_thread.start()
+        self.root.after(100, self.finish_scan, store, result)
+
+    def finish_scan(self, store, result):
+        """Apply scan results once the background thread is done"""
+        if self.scan_thread.is_alive():
+            self.root.after(100, self.finish_scan, store, result)
+            return
+
+        if "error" in result:
+            messagebox.showerror("Error", f"Failed to scan source code: {str(result['error'])}")
+            self.update_status()
+            return
+
+        store.set_usage(result["usage"])
+        if store is self.store:
+            self.update_table_headers()
+            self.refresh_search()
+
+    def add_missing_keys(self):
+        """Add every key used in source code but missing from the JSON files"""
+        if self.store.usage is None:
+            messagebox.showinfo("Info", "Scan the source code first (Tools > Scan Source Usage).")
+            return
+        if not self.data:
+            messagebox.showwarning("Warning", "No languages available. Add a language first.")
+            return
+
+        missing = sorted(self.store.undefined_keys(), key=str.lower)
+        if not missing:
+            messagebox.showinfo("Info", "No missing keys found.")
+            return
+        if not messagebox.askyesno("Add Missing Keys", f"Add {len(missing)} keys used in source code?"):
+            return
+
+        # Laravel JSON keys are the source text, so it doubles as the source value
+        for key in missing:
+            for lang in self.store.languages():
+                self.store.set_value(lang, key, key if lang == self.store.source_lang else "")
+
+        if self.auto_save.get():
+            self.save_files(show_message=False)
+
+        self.refresh_filtered_data()
+        self.refresh_table()
+        self.update_status()
+
+    def save_files(self, show_message=True):
+        """Save all translation files"""
+        try:
+            if self.client:
+                saved_files = self.client.call("save", project=self.store.directory)
+                self.store.dirty = False
+            else:
+                saved_files = self.store.save()
+
+            if show_message:
+                messagebox.showinfo("Success", f"Successfully saved {saved_files} files.")
+
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save files: {str(e)}")
+
+    def jump_to_key(self, event):
+        """Jump to key starting with typed letter"""
+        if event.char.isalnum():
+            letter = event.char.lower()
+            self.finish_rendering()
+            for item in self.tree.get_children():
+                key = self.tree.item(item, "values")[0].lower()
+                if key.startswith(letter):
+                    self.tree.selection_set(item)
+                    self.tree.see(item)
+                    break
+
+
+class SuggestionPanel:
+    """Translation memory suggestions shown inside the add and edit windows"""
+
+    def __init__(self, parent, app, get_query, on_pick, exclude=None):
+        self.app = app
+        self.get_query = get_query
+        self.on_pick = on_pick
+        self.exclude = exclude
+        self.pending = None
+        self.suggestions = {}
+        self.languages = [lang for lang in app.store.languages() if lang != app.store.source_lang]
+
+        frame = tk.LabelFrame(parent, text="Suggestions (click to fill empty translations)",
+                              font=("Arial", 10, "bold"))
+        frame.pack(fill="x", pady=(0, 10))
+
+        columns = ("Match", "Source") + tuple(self.languages)
+        self.tree = ttk.Treeview(frame, columns=columns, show="headings", height=4)
+        self.tree.heading("Match", text="Match")
+        self.tree.column("Match", width=50, minwidth=50, stretch=False)
+        self.tree.heading("Source", text=(app.store.source_lang or "").replace('.json', ''))
+        self.tree.column("Source", width=180, minwidth=100)
+        for lang in self.languages:
+            self.tree.heading(lang, text=lang.replace('.json', ''))
+            self.tree.column(lang, width=150, minwidth=80)
+        self.tree.pack(fill="x", padx=10, pady=5)
+
+        self.tree.bind("<ButtonRelease-1>", self.pick)
+        self.tree.bind("<Return>", self.pick)
+
+    def schedule(self, event=None):
+        """Refresh shortly after typing stops"""
+        if self.pending:
+            self.tree.after_cancel(self.pending)
+        self.pending = self.tree.after(250, self.refresh)
+
+    def refresh(self):
+        """Look up the current source text in the translation memory"""
+        self.pending = None
+        for item in self.tree.get_children():
+            self.tree.delete(item)
+
+        self.suggestions = {}
+        store = self.app.store
+        if store.memory is None:
+            # Built in a thread; the first lookup of a large project takes seconds
+            self.tree.insert("", "end", values=("", "Loading translation memory..."))
+            self.app.load_memory(store, self.refresh_if_open)
+            return
+        for score, key, translations in store.suggestions(self.get_query(), exclude=self.exclude):
+            values = [f"{score:.0%}", translations.get(store.source_lang, key)]
+            values += [translations.get(lang, "") for lang in self.languages]
+            item = self.tree.insert("", "end", values=values)
+            self.suggestions[item] = translations
+
+    def refresh_if_open(self):
+        if self.tree.winfo_exists():
+            self.refresh()
+
+    def pick(self, event=None):
+        """Fill empty translations from the clicked suggestion"""
+        item = self.tree.identify_row(event.y) if event and event.type == tk.EventType.ButtonRelease \
+            else self.tree.focus()
+        if item in self.suggestions:
+            self.on_pick(self.suggestions[item])
+
+
+class EditWindow:
+    """Enhanced edit window for translation entries"""
+
+    def __init__(self, app, key, values):
+        self.app = app
+        self.key = key        # rows may be rebuilt while the window is open
+        self.values = values  # {lang: value}
+
+        self.window = tk.Toplevel(app.root)
+        self.window.title(f"Edit Translation: {key}")
+        self.window.geometry("700x650")
+        self.window.transient(app.root)
+
+        # Center the window
+        self.window.update_idletasks()
+        x = (self.window.winfo_screenwidth() // 2) - (700 // 2)
+        y = (self.window.winfo_screenheight() // 2) - (650 // 2)
+        self.window.geometry(f"+{x}+{y}")
+
+        self.create_widgets()
+        self.setup_shortcuts()
+
+        # Set grab after window is fully created and visible
+        self.window.after(10, self.window.grab_set)
+
+        # Focus on key entry
+        self.key_entry.focus()
+        self.key_entry.select_range(0, tk.END)
+
+    def create_widgets(self):
+        """Create edit window widgets"""
+        main_frame = tk.Frame(self.window)
+        main_frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+        # Key section
+        key_frame = tk.LabelFrame(main_frame, text="Translation Key", font=("Arial", 10, "bold"))
+        key_frame.pack(fill="x", pady=(0, 10))
+
+        self.key_entry = tk.Entry(key_frame, font=("Arial", 11))
+        self.key_entry.pack(fill="x", padx=10, pady=10)
+        self.key_entry.insert(0, self.key)
+
+        # Add Ctrl+A support for key entry
+        self.key_entry.bind("<Control-a>", lambda e: self.app.select_all_entry(e))
+
+        # Translations section
+        trans_frame = tk.LabelFrame(main_frame, text="Translations", font=("Arial", 10, "bold"))
+        trans_frame.pack(fill="both", expand=True, pady=(0, 10))
+
+        # Create scrollable frame for translations
+        canvas = tk.Canvas(trans_frame)
+        scrollbar = ttk.Scrollbar(trans_frame, orient="vertical", command=canvas.yview)
+        scrollable_frame = tk.Frame(canvas)
+
+        scrollable_frame.bind(
+            "<Configure>",
+            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        )
+
+        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
+
+        self.entries = {}  # lang -> Text, for the languages present when the window opened
+
+        for lang in self.app.store.languages():
+            # Create frame for each language
+            lang_frame = tk.Frame(scrollable_frame)
+            lang_frame.pack(fill="x", padx=10, pady=5)
+
+            # Language label
+            lang_label = tk.Label(lang_frame, text=lang.replace('.json', ''),
+                                width=15, anchor="w", font=("Arial", 10, "bold"))
+            lang_label.pack(side="left")
+
+            # Text widget for multi-line support
+            text_widget = tk.Text(lang_frame, height=3, width=50, wrap=tk.WORD,
+                                font=("Arial", 10))
+            text_widget.pack(side="left", fill="x", expand=True, padx=(10, 0))
+
+            # Insert current value
+            text_widget.insert("1.0", self.values.get(lang, ""))
+
+            # Bind shortcuts for text widget
+            text_widget.bind("<Control-Return>", self.save)
+            text_widget.bind("<Escape>", lambda e: self.window.destroy())
+            text_widget.bind("<Control-a>", lambda e: self.app.select_all_text(e))
+
+            self.entries[lang] = text_widget
+
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+
+        # Translation memory suggestions for the source text
+        self.suggestions = SuggestionPanel(main_frame, self.app, self.get_source_text,
+                                           self.fill_translations, exclude=self.key)
+        if self.app.store.source_lang in self.entries:
+            self.entries[self.app.store.source_lang].bind("<KeyRelease>", self.suggestions.schedule)
+        self.suggestions.refresh()
+
+        # Buttons
+        button_frame = tk.Frame(main_frame)
+        button_frame.pack(fill="x")
+
+        tk.Button(button_frame, text="Save (Ctrl+S)", command=self.save,
+                 bg="#4CAF50", fg="white", font=("Arial", 10, "bold"), width=15).pack(side="left", padx=(0, 5))
+        tk.Button(button_frame, text="Delete (Del)", command=self.delete,
+                 bg="#f44336", fg="white", font=("Arial", 10), width=15).pack(side="left", padx=5)
+        tk.Button(button_frame, text="Cancel (Esc)", command=self.window.destroy,
+                 font=("Arial", 10), width=15).pack(side="right")
+
+    def get_source_text(self):
+        """Current source language text, falling back to the key"""
+        source_lang = self.app.store.source_lang
+        if source_lang in self.entries:
+            text = self.entries[source_lang].get("1.0", tk.END).strip()
+            if text:
+                return text
+        return self.key_entry.get().strip()
+
+    def fill_translations(self, translations):
+        """Copy a suggestion into the translations that are still empty"""
+        for lang, text_widget in self.entries.items():
+            if translations.get(lang) and not text_widget.get("1.0", tk.END).strip():
+                text_widget.insert("1.0", translations[lang])
+
+    def setup_shortcuts(self):
+        """Setup keyboard shortcuts for edit window"""
+        self.window.bind("<Control-s>", self.save)
+        self.window.bind("<Control-Return>", self.save)
+        self.window.bind("<Escape>", lambda e: self.window.destroy())
+        self.window.bind("<Delete>", lambda e: self.delete())
+
+    def save(self, event=None):
+        """Save translation changes"""
+        new_key = self.key_entry.get().strip()
+        if not new_key:
+            messagebox.showerror("Error", "Key cannot be empty.")
+            return
+
+        new_values = {lang: text_widget.get("1.0", tk.END).strip()
+                      for lang, text_widget in self.entries.items()}
+
+        if not self.app.confirm_consistency(new_key, new_values):
+            return
+
+        if self.app.update_value(self.key, new_key, new_values):
+            self.window.destroy()
+
+    def delete(self):
+        """Delete current translation key"""
+        if messagebox.askyesno("Delete Key", f"Are you sure you want to delete key '{self.key}'?"):
+            self.app.delete_key(self.key)
+            self.window.destroy()
+
+
+class AddKeyWindow:
+    """Window for adding new translation keys"""
+
+    def __init__(self, app):
+        self.app = app
+
+        self.window = tk.Toplevel(app.root)
+        self.window.title("Add New Translation Key")
+        self.window.geometry("700x550")
+        self.window.transient(app.root)
+
+        # Center the window
+        self.window.update_idletasks()
+        x = (self.window.winfo_screenwidth() // 2) - (700 // 2)
+        y = (self.window.winfo_screenheight() // 2) - (550 // 2)
+        self.window.geometry(f"+{x}+{y}")
+
+        self.create_widgets()
+
+        # Set grab after window is fully created
+        self.window.after(10, self.window.grab_set)
+
+        # Focus on key entry
+        self.key_entry.focus()
+
+    def create_widgets(self):
+        """Create add key window widgets"""
+        main_frame = tk.Frame(self.window)
+        main_frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+        # Key section
+        key_frame = tk.LabelFrame(main_frame, text="New Translation Key", font=("Arial", 10, "bold"))
+        key_frame.pack(fill="x", pady=(0, 10))
+
+        self.key_entry = tk.Entry(key_frame, font=("Arial", 11))
+        self.key_entry.pack(fill="x", padx=10, pady=10)
+        self.key_entry.bind("<Return>", lambda e: next(iter(self.entries.values())).focus() if self.entries else None)
+
+        # Add Ctrl+A support for key entry
+        self.key_entry.bind("<Control-a>", lambda e: self.app.select_all_entry(e))
+
+        # Translations section
+        if self.app.data:
+            trans_frame = tk.LabelFrame(main_frame, text="Translations", font=("Arial", 10, "bold"))
+            trans_frame.pack(fill="both", expand=True, pady=(0, 10))
+
+            self.entries = {}  # lang -> Entry, for the languages present when the window opened
+            for lang in self.app.store.languages():
+                lang_frame = tk.Frame(trans_frame)
+                lang_frame.pack(fill="x", padx=10, pady=5)
+
+                tk.Label(lang_frame, text=lang.replace('.json', ''),
+                        width=15, anchor="w", font=("Arial", 10, "bold")).pack(side="left")
+
+                entry = tk.Entry(lang_frame, font=("Arial", 10))
+                entry.pack(side="left", fill="x", expand=True, padx=(10, 0))
+                entry.bind("<Control-Return>", self.save)
+                entry.bind("<Escape>", lambda e: self.window.destroy())
+                entry.bind("<Control-a>", lambda e: self.app.select_all_entry(e))
+
+                self.entries[lang] = entry
+
+            # Translation memory suggestions for the source text (or the key itself)
+            self.suggestions = SuggestionPanel(main_frame, self.app, self.get_source_text,
+                                               self.fill_translations)
+            self.key_entry.bind("<KeyRelease>", self.suggestions.schedule)
+            if self.app.store.source_lang in self.entries:
+                self.entries[self.app.store.source_lang].bind("<KeyRelease>", self.suggestions.schedule)
+        else:
+            self.entries = {}
+            tk.Label(main_frame, text="No languages available. Add a language first.",
+                    font=("Arial", 10), fg="red").pack(pady=20)
+
+        # Buttons
+        button_frame = tk.Frame(main_frame)
+        button_frame.pack(fill="x")
+
+        tk.Button(button_frame, text="Add Key (Ctrl+S)", command=self.save,
+                 bg="#4CAF50", fg="white", font=("Arial", 10, "bold")).pack(side="left")
+        tk.Button(button_frame, text="Cancel (Esc)", command=self.window.destroy,
+                 font=("Arial", 10)).pack(side="right")
+
+        # Bind shortcuts
+        self.window.bind("<Control-s>", self.save)
+        self.window.bind("<Control-Return>", self.save)
+        self.window.bind("<Escape>", lambda e: self.window.destroy())
+
+    def get_source_text(self):
+        """Current source language text, falling back to the key"""
+        source_lang = self.app.store.source_lang
+        if source_lang in self.entries:
+            text = self.entries[source_lang].get().strip()
+            if text:
+                return text
+        return self.key_entry.get().strip()
+
+    def fill_translations(self, translations):
+        """Copy a suggestion into the translations that are still empty"""
+        for lang, entry in self.entries.items():
+            if translations.get(lang) and not entry.get().strip():
+                entry.insert(0, translations[lang])
+
+    def save(self, event=None):
+        """Save new translation key"""
+        new_key = self.key_entry.get().strip()
+        if not new_key:
+            messagebox.showerror("Error", "Key cannot be empty.")
+            return
+
+        # Check if key already exists
+        if self.app.store.has_key(new_key):
+            messagebox.showerror("Error", f"Key '{new_key}' already exists.")
+            return
+
+        new_values = {lang: entry.get().strip() for lang, entry in self.entries.items()}
+        if not self.app.confirm_consistency(new_key, new_values):
+            return
+
+        # Add new key with translations; languages added meanwhile get an empty value
+        for lang in self.app.store.languages():
+            self.app.store.set_value(lang, new_key, new_values.get(lang, ""))
+
+        if self.app.auto_save.get():
+            self.app.save_files(show_message=False)
+
+        self.app.refresh_filtered_data()
+        self.app.refresh_table()
+        self.app.update_status()
+        self.window.destroy()
+
+
+class WorkspaceSearchWindow:
+    """Search keys and values across all projects of the workspace"""
+
+    def __init__(self, app):
+        self.app = app
+
+        self.window = tk.Toplevel(app.root)
+        self.window.title("Search All Projects")
+        self.window.geometry("800x500")
+        self.window.transient(app.root)
+
+        # Center the window
+        self.window.update_idletasks()
+        x = (self.window.winfo_screenwidth() // 2) - (800 // 2)
+        y = (self.window.winfo_screenheight() // 2) - (500 // 2)
+        self.window.geometry(f"+{x}+{y}")
+
+        self.create_widgets()
+
+        # Focus on search entry
+        self.search_entry.focus()
+
+    def create_widgets(self):
+        """Create workspace search widgets"""
+        main_frame = tk.Frame(self.window)
+        main_frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+        search_frame = tk.Frame(main_frame)
+        search_frame.pack(fill="x", pady=(0, 10))
+
+        tk.Label(search_frame, text="Search:", font=("Arial", 10, "bold")).pack(side="left")
+        self.search_entry = tk.Entry(search_frame, font=("Arial", 11))
+        self.search_entry.pack(side="left", fill="x", expand=True, padx=(5, 10))
+        self.search_entry.insert(0, self.app.search_var.get())
+        self.search_entry.bind("<Return>", lambda e: self.search())
+        self.search_entry.bind("<Control-a>", lambda e: self.app.select_all_entry(e))
+        tk.Button(search_frame, text="Search", command=self.search,
+                 font=("Arial", 10), width=10).pack(side="left")
+
+        # Results table
+        table_frame = tk.Frame(main_frame)
+        table_frame.pack(fill="both", expand=True)
+
+        self.tree = ttk.Treeview(table_frame, columns=("Project", "Key", "Value"), show="headings")
+        scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        for col, width in (("Project", 180), ("Key", 250), ("Value", 350)):
+            self.tree.heading(col, text=col)
+            self.tree.column(col, width=width, minwidth=100)
+        scrollbar.pack(side="right", fill="y")
+        self.tree.pack(fill="both", expand=True)
+
+        self.tree.bind("<Double-1>", lambda e: self.open_result())
+        self.tree.bind("<Return>", lambda e: self.open_result())
+
+        self.status_label = tk.Label(main_frame, text="Double-click a result to open it", anchor="w")
+        self.status_label.pack(fill="x", pady=(5, 0))
+
+        self.window.bind("<Escape>", lambda e: self.window.destroy())
+
+    def search(self):
+        """Run the search over every open project"""
+        term = self.search_entry.get().strip().lower()
+        for item in self.tree.get_children():
+            self.tree.delete(item)
+        self.results = {}
+        if not term:
+            return
+
+        workspace = self.app.workspace
+        for store, key in workspace.search(term, self.app.search_keys.get(),
+                                           self.app.search_values.get()):
+            value = next((translations[key] for translations in store.data.values()
+                          if translations.get(key)), "")
+            item = self.tree.insert("", "end", values=(store.name, key, value))
+            self.results[item] = (store.directory, key)
+
+        self.status_label.config(text=f"{len(self.results)} matches in {len(workspace.projects)} projects")
+
+    def open_result(self):
+        """Switch to the project of the selected result and show its key"""
+        selection = self.tree.selection()
+        if selection:
+            directory, key = self.results[selection[0]]
+            self.app.switch_project(directory)
+            self.app.select_key(key)
+
+
+class DuplicatesWindow:
+    """Analysis view of keys whose source values are identical or near-identical"""
+
+    def __init__(self, app):
+        self.app = app
+        self.store = app.store
+
+        self.window = tk.Toplevel(app.root)
+        self.window.title(f"Duplicates - {self.store.name}")
+        self.window.geometry("900x550")
+        self.window.transient(app.root)
+
+        # Center the window
+        self.window.update_idletasks()
+        x = (self.window.winfo_screenwidth() // 2) - (900 // 2)
+        y = (self.window.winfo_screenheight() // 2) - (550 // 2)
+        self.window.geometry(f"+{x}+{y}")
+
+        self.create_widgets()
+        self.refresh()
+
+    def create_widgets(self):
+        """Create duplicates window widgets"""
+        main_frame = tk.Frame(self.window)
+        main_frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+        options_frame = tk.Frame(main_frame)
+        options_frame.pack(fill="x", pady=(0, 10))
+
+        self.only_diverging = tk.BooleanVar(value=False)
+        tk.Checkbutton(options_frame, text="Only groups with diverging translations",
+                       variable=self.only_diverging, command=self.refresh).pack(side="left")
+        tk.Button(options_frame, text="Refresh", command=self.refresh,
+                 font=("Arial", 10), width=10).pack(side="right")
+
+        # Groups with their keys as children
+        table_frame = tk.Frame(main_frame)
+        table_frame.pack(fill="both", expand=True)
+
+        columns = tuple(self.store.languages())
+        self.tree = ttk.Treeview(table_frame, columns=columns, show="tree headings")
+        v_scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=self.tree.yview)
+        h_scrollbar = ttk.Scrollbar(table_frame, orient="horizontal", command=self.tree.xview)
+        self.tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+
+        self.tree.heading("#0", text="Source value / Key")
+        self.tree.column("#0", width=280, minwidth=150)
+        for lang in columns:
+            self.tree.heading(lang, text=lang.replace('.json', ''))
+            self.tree.column(lang, width=180, minwidth=100)
+
+        v_scrollbar.pack(side="right", fill="y")
+        h_scrollbar.pack(side="bottom", fill="x")
+        self.tree.pack(fill="both", expand=True)
+
+        self.tree.tag_configure("diverging", background="#ffeeee")
+        self.tree.tag_configure("group", font=("Arial", 10, "bold"))
+
+        self.tree.bind("<Double-1>", lambda e: self.open_key())
+        self.tree.bind("<Return>", lambda e: self.open_key())
+
+        self.status_label = tk.Label(main_frame, anchor="w")
+        self.status_label.pack(fill="x", pady=(5, 0))
+
+        self.window.bind("<Escape>", lambda e: self.window.destroy())
+
+    def refresh(self):
+        """Regroup from the store's value hash index, which edits keep current"""
+        for item in self.tree.get_children():
+            self.tree.delete(item)
+
+        self.keys = {}
+        groups = self.store.duplicate_groups()
+        diverging_groups = sum(1 for group in groups if group["diverging"])
+        languages = self.store.languages()
+
+        for group in groups:
+            if self.only_diverging.get() and not group["diverging"]:
+                continue
+
+            kind = "identical" if group["exact"] else "near-identical"
+            label = f"{group['value']}  ({len(group['keys'])} keys, {kind})"
+            values = ["differs" if lang in group["diverging"] else "" for lang in languages]
+            tags = ("group", "diverging") if group["diverging"] else ("group",)
+            parent = self.tree.insert("", "end", text=label, values=values, tags=tags, open=True)
+
+            for key in group["keys"]:
+                values = [self.store.data[lang].get(key, "") for lang in languages]
+                item = self.tree.insert(parent, "end", text=key, values=values)
+                self.keys[item] = key
+
+        self.status_label.config(
+            text=f"{len(groups)} duplicate groups, {diverging_groups} with diverging translations "
+                 f"(source: {self.store.source_lang})")
+
+    def open_key(self):
+        """Show the selected key in the main table"""
+        selection = self.tree.selection()
+        if selection and selection[0] in self.keys:
+            if self.app.store is not self.store:
+                self.app.switch_project(self.store.directory)
+            self.app.select_key(self.keys[selection[0]])
+
+
+class LanguageDialog:
+    """Simple dialog for language input"""
+
+    def __init__(self, parent, title, prompt):
+        self.result = None
+
+        self.dialog = tk.Toplevel(parent)
+        self.dialog.title(title)
+        self.dialog.geometry("400x150")
+        self.dialog.transient(parent)
+
+        # Center dialog
+        self.dialog.update_idletasks()
+        x = (self.dialog.winfo_screenwidth() // 2) - (400 // 2)
+        y = (self.dialog.winfo_screenheight() // 2) - (150 // 2)
+        self.dialog.geometry(f"+{x}+{y}")
+
+        # Create widgets
+        tk.Label(self.dialog, text=prompt, font=("Arial", 10)).pack(pady=10)
+
+        self.entry = tk.Entry(self.dialog, font=("Arial", 11), width=40)
+        self.entry.pack(pady=10)
+        self.entry.focus()
+
+        # Add Ctrl+A support
+        self.entry.bind("<Control-a>", self.select_all_entry)
+
+        # Buttons
+        button_frame = tk.Frame(self.dialog)
+        button_frame.pack(pady=10)
+
+        tk.Button(button_frame, text="OK", command=self.ok_clicked,
+                 font=("Arial", 10), width=10).pack(side="left", padx=5)
+        tk.Button(button_frame, text="Cancel", command=self.cancel_clicked,
+                 font=("Arial", 10), width=10).pack(side="left", padx=5)
+
+        # Bind keys
+        self.entry.bind("<Return>", lambda e: self.ok_clicked())
+        self.dialog.bind("<Escape>", lambda e: self.cancel_clicked())
+
+        # Set grab after dialog is ready
+        self.dialog.after(10, self.dialog.grab_set)
+
+        # Wait for dialog to close
+        self.dialog.wait_window()
+
+    def ok_clicked(self):
+        self.result = self.entry.get().strip()
+        self.dialog.destroy()
+
+    def select_all_entry(self, event):
+        """Select all text in Entry widget"""
+        event.widget.select_range(0, tk.END)
+        return "break"
+
+    def cancel_clicked(self):
+        self.result = None
+        self.dialog.destroy()
+
+
+class LanguageSelectionDialog:
+    """Dialog for selecting from existing languages"""
+
+    def __init__(self, parent, title, prompt, options):
+        self.result = None
+
+        self.dialog = tk.Toplevel(parent)
+        self.dialog.title(title)
+        self.dialog.geometry("400x300")
+        self.dialog.transient(parent)
+
+        # Center dialog
+        self.dialog.update_idletasks()
+        x = (self.dialog.winfo_screenwidth() // 2) - (400 // 2)
+        y = (self.dialog.winfo_screenheight() // 2) - (300 // 2)
+        self.dialog.geometry(f"+{x}+{y}")
+
+        # Create widgets
+        tk.Label(self.dialog, text=prompt, font=("Arial", 10)).pack(pady=10)
+
+        # Listbox with scrollbar
+        list_frame = tk.Frame(self.dialog)
+        list_frame.pack(fill="both", expand=True, padx=20, pady=10)
+
+        scrollbar = tk.Scrollbar(list_frame)
+        scrollbar.pack(side="right", fill="y")
+
+        self.listbox = tk.Listbox(list_frame, yscrollcommand=scrollbar.set, font=("Arial", 10))
+        self.listbox.pack(side="left", fill="both", expand=True)
+        scrollbar.config(command=self.listbox.yview)
+
+        # Add options
+        for option in options:
+            self.listbox.insert(tk.END, option)
+
+        # Select first item
+        if options:
+            self.listbox.selection_set(0)
+            self.listbox.focus()
+
+        # Buttons
+        button_frame = tk.Frame(self.dialog)
+        button_frame.pack(pady=10)
+
+        tk.Button(button_frame, text="OK", command=self.ok_clicked,
+                 font=("Arial", 10), width=10).pack(side="left", padx=5)
+        tk.Button(button_frame, text="Cancel", command=self.cancel_clicked,
+                 font=("Arial", 10), width=10).pack(side="left", padx=5)
+
+        # Bind keys
+        self.listbox.bind("<Double-1>", lambda e: self.ok_clicked())
+        self.listbox.bind("<Return>", lambda e: self.ok_clicked())
+        self.dialog.bind("<Escape>", lambda e: self.cancel_clicked())
+
+        # Set grab after dialog is ready
+        self.dialog.after(10, self.dialog.grab_set)
+
+        # Wait for dialog to close
+        self.dialog.wait_window()
+
+    def ok_clicked(self):
+        selection = self.listbox.curselection()
+        if selection:
+            self.result = self.listbox.get(selection[0])
+        self.dialog.destroy()
+
+    def cancel_clicked(self):
+        self.result = None
+        self.dialog.destroy()
+
+
+def run_validation(directories, workers=None):
+    """Check every directory from the command line; return the exit status"""
+    status = 0
+    for directory in directories:
+        store = TranslationStore(directory)
+        store.load(validate=False)
+        for file_name, error in store.errors:
+            print(f"{store.path(file_name)}: failed to load: {error}")
+            status = 1
+
+        violations = store.validate_all(workers)
+        for key in sorted(violations, key=str.lower):
+            for lang, problems in sorted(violations[key].items()):
+                print(f"{store.path(lang)}: {key}: {', '.join(problems)}")
+        if violations:
+            status = 1
+        print(f"{store.directory}: {len(violations)} inconsistent keys (source: {store.source_lang})")
+    return status
+
+
+def run_daemon(directories, socket_path):
+    """Load the directories once and serve them until interrupted"""
+    workspace = Workspace()
+    for directory in directories:
+        store = workspace.open(directory, activate=False)
+        for file_name, error in store.errors:
+            print(f"{store.path(file_name)}: failed to load: {error}", file=sys.stderr)
+
+    import asyncio
+
+    try:
+        asyncio.run(TranslationDaemon(workspace, socket_path).serve())
+    except DaemonError as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def run_call(socket_path, method, params):
+    """Call one daemon method from the command line, e.g. in a git hook"""
+    try:
+        params = json.loads(params)
+        if not isinstance(params, dict):
+            raise ValueError("--params must be a JSON object")
+        client = DaemonClient(socket_path)
+        result = client.call(method, **params)
+    except (OSError, ValueError, DaemonError) as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        return 1
+    client.close()
+    print(json.dumps(result, ensure_ascii=False, indent=4))
+    return 0
+
+
+def main(started=None):
+    """Command line entry point; started is the launcher's time.perf_counter()"""
+    parser = argparse.ArgumentParser(description="Manage Laravel JSON translation files.")
+    parser.add_argument("directories", nargs="*",
+                        help="lang directories to open (default: current directory)")
+    parser.add_argument("--validate", action="store_true",
+                        help="check placeholders, pluralization and markup against the source "
+                             "language, print problems and exit with status 1 if there are any")
+    parser.add_argument("--daemon", action="store_true",
+                        help="keep the directories loaded and serve them over JSON-RPC on --socket")
+    parser.add_argument("--attach", action="store_true",
+                        help="open the editor as a client of a running daemon")
+    parser.add_argument("--call", metavar="METHOD",
+                        help="call a daemon method, print the JSON result and exit")
+    parser.add_argument("--params", default="{}",
+                        help="JSON object of parameters for --call")
+    parser.add_argument("--socket", default=DAEMON_SOCKET,
+                        help=f"daemon socket path (default: {DAEMON_SOCKET})")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="print how long the window and the first rows took to appear")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes for --validate (default: number of CPUs, "
+                             "0: check in this process)")
+    args = parser.parse_args()
+
+    if args.validate:
+        sys.exit(run_validation(args.directories or [os.getcwd()], args.workers))
+    if args.daemon:
+        sys.exit(run_daemon(args.directories or [os.getcwd()], args.socket))
+    if args.call:
+        sys.exit(run_call(args.socket, args.call, args.params))
+
+    client = None
+    if args.attach:
+        try:
+            client = DaemonClient(args.socket)
+        except OSError as e:
+            parser.error(f"cannot connect to the daemon at {args.socket}: {str(e)}")
+
+    root = tk.Tk()
+    TranslatorApp(root, args.directories, client, args.startup_report, started)
+    root.mainloop()